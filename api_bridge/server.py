@@ -35,7 +35,7 @@ load_dotenv()
 try:
   
     from bot.core import EclipseEternal
-    from config.settings import Config, MicroConfig
+    from config.settings import Config, micro_config
     from utils.logging import log_core, log_entry
     ECLIPSE_AVAILABLE = True
     print("[OK] Eclipse Scalper modulleri yuklendi")
@@ -652,7 +652,7 @@ async def connect_exchange(request: ConnectRequest):
             bot = EclipseEternal()
 
             # Config seç (equity'ye göre otomatik seçilecek)
-            bot.cfg = MicroConfig() if request.testnet else Config()
+            bot.cfg = micro_config() if request.testnet else Config()
 
             # Exchange bağlantısı yap
             try:
@@ -793,6 +793,8 @@ async def start_bot(request: BotStartRequest):
             # Config'i güncelle
             if hasattr(bot.cfg, 'ACTIVE_SYMBOLS'):
                 bot.cfg.ACTIVE_SYMBOLS = request.symbols
+                if hasattr(bot.cfg, 'refresh_entry_params'):
+                    bot.cfg.refresh_entry_params()
 
             # Dry run mode
             if request.dry_run:
@@ -8,13 +8,62 @@ Bot Manager - Ana Bot Yönetim Sınıfı
 """
 
 import asyncio
+import time
+from collections import deque
 from datetime import datetime
-from typing import Optional, Callable, List, Dict, Any
+from itertools import count, islice
+from typing import Optional, Callable, Awaitable, List, Dict, Any, Deque
+import numpy as np
+import orjson
 from binance.client import Client
 from binance import AsyncClient, BinanceSocketManager
 
 from .config import BotConfig
-from .strategies import get_strategy
+from .strategies import get_strategy, klines_to_ohlcv, CLOSE
+from .strategies.kernels import rsi_batch
+
+# Bellekte tutulacak maksimum işlem / sinyal kaydı (eskiler otomatik düşer)
+MAX_HISTORY = 10_000
+
+# Görev öncelikleri (küçük sayı = daha acil)
+PRIORITY_TRADE = 0   # İşlem yürütme
+PRIORITY_SIGNAL = 1  # Sinyal yayını
+PRIORITY_STATUS = 2  # Durum (status) ping'leri
+
+# Kuyrukta bundan fazla iş bekliyorsa yeni status ping'leri düşürülür
+MAX_PENDING_STATUS = 100
+
+# scan() sırasında aynı anda açık tutulacak en fazla REST kline isteği
+SCAN_MAX_CONCURRENCY = 8
+
+# Mum kapanışından sonra borsanın veriyi yayınlaması için bekleme payı
+KLINE_CLOSE_MARGIN_MS = 500
+
+# Binance mum aralığı birimleri (milisaniye)
+_INTERVAL_UNIT_MS = {
+    "s": 1_000,
+    "m": 60_000,
+    "h": 3_600_000,
+    "d": 86_400_000,
+    "w": 604_800_000,
+    "M": 2_592_000_000,  # ~30 gün
+}
+
+
+def interval_to_ms(interval: str) -> int:
+    """'1m', '15m', '4h', '1d' gibi mum aralığını milisaniyeye çevir"""
+    try:
+        return int(interval[:-1]) * _INTERVAL_UNIT_MS[interval[-1]]
+    except (KeyError, ValueError, IndexError):
+        return 60_000
+
+
+def seconds_until_next_close(interval_ms: int, now_ms: Optional[int] = None) -> float:
+    """Bir sonraki mum kapanışına (+ yayın payı) kalan süre (saniye)"""
+    if now_ms is None:
+        now_ms = int(time.time() * 1000)
+    next_close_ms = (now_ms // interval_ms + 1) * interval_ms + KLINE_CLOSE_MARGIN_MS
+    return (next_close_ms - now_ms) / 1000
 
 
 class BotManager:
@@ -43,8 +92,8 @@ class BotManager:
         self.total_trades: int = 0
         self.winning_trades: int = 0
         self.profit: float = 0.0
-        self.trades: List[Dict] = []
-        self.signals: List[Dict] = []
+        self.trades: Deque[Dict] = deque(maxlen=MAX_HISTORY)
+        self.signals: Deque[Dict] = deque(maxlen=MAX_HISTORY)
 
         # Son durum
         self.last_signal: Optional[str] = None
@@ -54,9 +103,23 @@ class BotManager:
         self.on_signal: Optional[Callable] = None
         self.on_trade: Optional[Callable] = None
 
+        # get_status önbelleği: durum değiştikçe versiyon artar,
+        # JSON sadece versiyon değiştiğinde yeniden üretilir
+        self._status_version: int = 0
+        self._cached_status_version: int = -1
+        self._cached_status_json: str = ""
+
+        # Son döngüde kullanılan OHLCV matrisi
+        self._ohlcv: Optional[np.ndarray] = None
+
         # Background task
         self._task: Optional[asyncio.Task] = None
 
+        # Öncelikli iş kuyruğu: (öncelik, sıra, tür, iş)
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._queue_seq = count()
+        self._scheduler_task: Optional[asyncio.Task] = None
+
     async def connect(self, api_key: str, api_secret: str, testnet: bool = True) -> bool:
         """
         Binance API'ye bağlan.
@@ -112,6 +175,7 @@ class BotManager:
         self.config = config
         self.is_running = True
         self.start_time = datetime.now()
+        self._touch_status()
 
         # Stratejiyi al
         strategy = get_strategy(config.strategy)
@@ -128,6 +192,7 @@ class BotManager:
             return False
 
         self.is_running = False
+        self._touch_status()
 
         if self._task:
             self._task.cancel()
@@ -161,14 +226,22 @@ class BotManager:
                     limit=100
                 )
 
-                # Son fiyatı kaydet
-                self.last_price = float(klines[-1][4])  # Close price
+                # Mum verisini bir kez NumPy matrisine çevir; kapanış dizisi paylaşılır
+                self._ohlcv = klines_to_ohlcv(klines)
+                closes = self._ohlcv[:, CLOSE]
+
+                # Son fiyatı kaydet (float32 matristen değil, ham veriden float64)
+                price = float(klines[-1][4])  # Close price
+                if price != self.last_price:
+                    self.last_price = price
+                    self._touch_status()
 
                 # 2. Strateji sinyali hesapla
-                signal = strategy.calculate(klines, self.config)
+                signal = strategy.calculate(self._ohlcv, closes, self.config)
 
                 if signal and signal != "HOLD":
                     self.last_signal = signal
+                    self._touch_status()
 
                     # Sinyal bilgisini kaydet
                     signal_data = {
@@ -182,16 +255,23 @@ class BotManager:
 
                     # Callback ile bildir
                     if self.on_signal:
-                        await self.on_signal(signal_data)
+                        await self.schedule(
+                            PRIORITY_SIGNAL, "signal",
+                            lambda data=signal_data: self.on_signal(data)
+                        )
 
                     # 3. İşlem yap (eğer sinyal varsa)
                     # ████████████████████████████████████████████████████
                     # █  BURAYA İŞLEM YAPMA KODLARINI EKLE               █
                     # ████████████████████████████████████████████████████
-                    # await self._execute_trade(signal)
+                    # await self.schedule(
+                    #     PRIORITY_TRADE, "trade",
+                    #     lambda sig=signal: self._execute_trade(sig)
+                    # )
 
-                # Bir sonraki kontrole kadar bekle
-                await asyncio.sleep(60)  # 1 dakika bekle
+                # Bir sonraki mum kapanışına kadar bekle
+                # (interval update_config ile değişebileceği için her turda okunur)
+                await asyncio.sleep(seconds_until_next_close(interval_to_ms(self.config.interval)))
 
             except asyncio.CancelledError:
                 break
@@ -229,7 +309,7 @@ class BotManager:
 
             # İşlem kaydını ekle
             trade_data = {
-                "id": str(len(self.trades) + 1),
+                "id": str(self.total_trades + 1),
                 "type": signal,
                 "symbol": self.config.symbol,
                 "price": self.last_price,
@@ -239,6 +319,7 @@ class BotManager:
             }
             self.trades.append(trade_data)
             self.total_trades += 1
+            self._touch_status()
 
             # Callback ile bildir
             if self.on_trade:
@@ -247,11 +328,139 @@ class BotManager:
         except Exception as e:
             print(f"İşlem hatası: {e}")
 
+    async def schedule(self, priority: int, kind: str, job: Callable[[], Awaitable]) -> bool:
+        """
+        İşi öncelikli kuyruğa ekle.
+
+        Args:
+            priority: PRIORITY_TRADE / PRIORITY_SIGNAL / PRIORITY_STATUS
+            kind: Log için iş türü ("trade", "signal", "status" ...)
+            job: Çağrıldığında coroutine döndüren fonksiyon
+
+        Returns:
+            İş kuyruğa eklendiyse True, kuyruk yoğun olduğu için düşürüldüyse False
+        """
+        self._ensure_scheduler()
+
+        # Kuyruk meşgulken ertelenebilir işleri (status) düşür
+        if priority >= PRIORITY_STATUS and self._queue.qsize() > MAX_PENDING_STATUS:
+            return False
+
+        await self._queue.put((priority, next(self._queue_seq), kind, job))
+        return True
+
+    def _ensure_scheduler(self):
+        """Scheduler task'ı çalışmıyorsa başlat"""
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._scheduler_task = asyncio.create_task(self._scheduler())
+
+    async def _scheduler(self):
+        """Kuyruktaki işleri öncelik sırasına göre tek tek çalıştır"""
+        while True:
+            priority, _, kind, job = await self._queue.get()
+            try:
+                await job()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Zamanlanmış iş hatası ({kind}, P{priority}): {e}")
+            finally:
+                self._queue.task_done()
+
+    async def shutdown(self):
+        """Botu durdur ve scheduler'ı kapat"""
+        await self.stop()
+
+        if self._scheduler_task:
+            self._scheduler_task.cancel()
+            try:
+                await self._scheduler_task
+            except asyncio.CancelledError:
+                pass
+            self._scheduler_task = None
+
     async def update_config(self, config: BotConfig) -> bool:
         """Bot ayarlarını güncelle"""
         self.config = config
+        self._touch_status()
         return True
 
+    async def scan(self, symbols: List[str], config: BotConfig, limit: int = 100) -> Optional[List[Dict]]:
+        """
+        Birden çok sembol için anlık RSI sinyallerini hesapla.
+
+        Kline'lar senkron istemciyle thread'lerde, sınırlı eşzamanlılıkla çekilir.
+        Kapanışlar (n_symbols, max_bars) float32 matrisine soldan NaN dolgulu
+        dizilir ve RSI tek bir paralel çekirdek çağrısıyla hesaplanır.
+        """
+        if not self.client:
+            print("Önce Binance'e bağlanmalısınız!")
+            return None
+
+        sem = asyncio.Semaphore(SCAN_MAX_CONCURRENCY)
+
+        async def fetch(symbol: str):
+            async with sem:
+                try:
+                    return await asyncio.to_thread(
+                        self.client.get_klines,
+                        symbol=symbol,
+                        interval=config.interval,
+                        limit=limit
+                    )
+                except Exception as e:
+                    print(f"Tarama hatası ({symbol}): {e}")
+                    return None
+
+        # gather sonuçları girdi sırasını korur
+        fetched = await asyncio.gather(*(fetch(symbol) for symbol in symbols))
+
+        scanned: List[str] = []
+        closes_rows: List[np.ndarray] = []
+        last_prices: List[float] = []
+
+        for symbol, klines in zip(symbols, fetched):
+            if not klines:
+                continue
+
+            scanned.append(symbol)
+            closes_rows.append(klines_to_ohlcv(klines)[:, CLOSE])
+            last_prices.append(float(klines[-1][4]))
+
+        if not scanned:
+            return []
+
+        # Yeni listelenen semboller daha kısa olabilir; soldan NaN ile doldur,
+        # çekirdek her satırda ilk sonlu değerden başlar (tam seri kullanılır)
+        n_bars = max(len(row) for row in closes_rows)
+        closes = np.full((len(closes_rows), n_bars), np.nan, dtype=np.float32)
+        for i, row in enumerate(closes_rows):
+            if len(row):
+                closes[i, -len(row):] = row
+
+        rsi_values = rsi_batch(closes, config.rsi_period)
+
+        results: List[Dict] = []
+        for symbol, price, rsi in zip(scanned, last_prices, rsi_values.tolist()):
+            if rsi != rsi:  # NaN -> yetersiz veri
+                signal = None
+                rsi = None
+            elif rsi < config.rsi_oversold:
+                signal = "BUY"
+            elif rsi > config.rsi_overbought:
+                signal = "SELL"
+            else:
+                signal = "HOLD"
+
+            results.append({
+                "symbol": symbol,
+                "price": price,
+                "rsi": rsi,
+                "signal": signal,
+            })
+
+        return results
+
     def get_status(self) -> Dict[str, Any]:
         """Bot durumunu getir"""
         win_rate = (self.winning_trades / self.total_trades * 100) if self.total_trades > 0 else 0
@@ -268,10 +477,31 @@ class BotManager:
             "last_price": self.last_price,
         }
 
+    def get_status_json(self) -> str:
+        """
+        Bot durumunu JSON metni olarak getir.
+        Durum son çağrıdan beri değişmediyse önbellekteki metin döner.
+        """
+        if self._cached_status_version != self._status_version:
+            self._cached_status_json = orjson.dumps(self.get_status()).decode()
+            self._cached_status_version = self._status_version
+        return self._cached_status_json
+
+    def _touch_status(self):
+        """Durumu değiştiren her işlemden sonra çağrılır (status önbelleğini geçersiz kılar)"""
+        self._status_version += 1
+
     def get_trades(self, limit: int = 50) -> List[Dict]:
         """Son işlemleri getir"""
-        return self.trades[-limit:]
+        return self._tail(self.trades, limit)
 
     def get_signals(self, limit: int = 20) -> List[Dict]:
         """Son sinyalleri getir"""
-        return self.signals[-limit:]
+        return self._tail(self.signals, limit)
+
+    @staticmethod
+    def _tail(items: Deque[Dict], limit: int) -> List[Dict]:
+        """Deque'nun son 'limit' elemanını liste olarak döndür"""
+        if limit <= 0:
+            return []
+        return list(islice(items, max(0, len(items) - limit), None))
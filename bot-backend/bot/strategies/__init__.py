@@ -6,7 +6,7 @@ Trading Stratejileri
 ████████████████████████████████████████████████████████████████
 """
 
-from .base import BaseStrategy
+from .base import BaseStrategy, klines_to_ohlcv, CLOSE
 from .rsi import RSIStrategy
 from .sma import SMAStrategy
 from .macd import MACDStrategy
@@ -18,7 +18,8 @@ def get_strategy(name: str) -> BaseStrategy:
 
     KULLANIM:
     strategy = get_strategy("rsi")
-    signal = strategy.calculate(klines, config)
+    ohlcv = klines_to_ohlcv(klines)
+    signal = strategy.calculate(ohlcv, ohlcv[:, CLOSE], config)
     """
     strategies = {
         "rsi": RSIStrategy(),
@@ -31,4 +32,7 @@ def get_strategy(name: str) -> BaseStrategy:
     return strategies.get(name, RSIStrategy())
 
 
-__all__ = ["BaseStrategy", "RSIStrategy", "SMAStrategy", "MACDStrategy", "get_strategy"]
+__all__ = [
+    "BaseStrategy", "RSIStrategy", "SMAStrategy", "MACDStrategy",
+    "get_strategy", "klines_to_ohlcv", "CLOSE",
+]
@@ -4,8 +4,26 @@ Base Strateji Sınıfı - Tüm stratejiler bundan türetilmeli
 
 from abc import ABC, abstractmethod
 from typing import List, Optional
+import numpy as np
 from ..config import BotConfig
 
+# Binance kline satırı: [open_time, open, high, low, close, volume, close_time, ...]
+OHLCV_COLUMNS = slice(1, 6)
+
+# OHLCV matrisindeki kolon indeksleri
+OPEN, HIGH, LOW, CLOSE, VOLUME = range(5)
+
+
+def klines_to_ohlcv(klines: List) -> np.ndarray:
+    """
+    Binance kline listesini (N, 5) float32 OHLCV matrisine çevir.
+    String -> float dönüşümü NumPy içinde tek seferde yapılır.
+    İndikatörler için float32 yeterli; emir miktarı hesapları float64 kalır.
+    """
+    if len(klines) == 0:
+        return np.empty((0, 5), dtype=np.float32)
+    return np.array(klines, dtype=object)[:, OHLCV_COLUMNS].astype(np.float64).astype(np.float32)
+
 
 class BaseStrategy(ABC):
     """
@@ -23,13 +41,14 @@ class BaseStrategy(ABC):
         self.confidence = 0.0
 
     @abstractmethod
-    def calculate(self, klines: List, config: BotConfig) -> Optional[str]:
+    def calculate(self, ohlcv: np.ndarray, closes: np.ndarray, config: BotConfig) -> Optional[str]:
         """
         Strateji sinyali hesapla.
 
         Args:
-            klines: Binance'ten gelen mum verileri
-                   [[timestamp, open, high, low, close, volume, ...], ...]
+            ohlcv: klines_to_ohlcv() ile üretilmiş (N, 5) matris
+                   [[open, high, low, close, volume], ...]
+            closes: Kapanış fiyatları (ohlcv[:, CLOSE]); tüm stratejiler aynı diziyi paylaşır
             config: Bot konfigürasyonu
 
         Returns:
@@ -44,19 +63,3 @@ class BaseStrategy(ABC):
     def get_confidence(self) -> float:
         """Son sinyalin güven seviyesini döndür (0-1 arası)"""
         return self.confidence
-
-    def _extract_closes(self, klines: List) -> List[float]:
-        """Kline verilerinden kapanış fiyatlarını çıkar"""
-        return [float(k[4]) for k in klines]
-
-    def _extract_highs(self, klines: List) -> List[float]:
-        """Kline verilerinden en yüksek fiyatları çıkar"""
-        return [float(k[2]) for k in klines]
-
-    def _extract_lows(self, klines: List) -> List[float]:
-        """Kline verilerinden en düşük fiyatları çıkar"""
-        return [float(k[3]) for k in klines]
-
-    def _extract_volumes(self, klines: List) -> List[float]:
-        """Kline verilerinden hacim verilerini çıkar"""
-        return [float(k[5]) for k in klines]
@@ -0,0 +1,153 @@
+"""
+İndikatör Çekirdekleri (Numba)
+
+Stratejilerin sıcak yolundaki hesaplamalar burada tip imzalı @njit
+fonksiyonları olarak tanımlanır. calculate() metotları sadece bu
+çekirdekleri çağırır ve sonucu (sebep metni vb.) formatlar.
+
+Fiyat dizileri float32 tutulur (bellek bant genişliği yarıya iner);
+toplamalar kayıp birikmesin diye float64 akümülatörde yapılır.
+
+Numba kurulu değilse aynı fonksiyonlar saf Python olarak çalışır.
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Numba yoksa dekoratör fonksiyonu olduğu gibi döndürür"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+# Sinyal kodları (çekirdeklerden dönen int8 değerleri)
+SIGNAL_NONE = 0
+SIGNAL_BUY = 1
+SIGNAL_SELL = -1
+
+
+@njit("f4(f4[:], i4)", cache=True)
+def rsi_last(closes, period):
+    """Son 'period' değişim üzerinden RSI; yetersiz veri varsa NaN"""
+    n = closes.shape[0]
+    if period <= 0 or n < period + 1:
+        return math.nan
+
+    gain = 0.0
+    loss = 0.0
+    for i in range(n - period, n):
+        d = closes[i] - closes[i - 1]
+        if d > 0:
+            gain += d
+        elif d < 0:
+            loss -= d
+
+    avg_gain = gain / period
+    avg_loss = loss / period
+    if avg_loss == 0:
+        return 100.0
+
+    rs = avg_gain / avg_loss
+    return 100.0 - (100.0 / (1.0 + rs))
+
+
+@njit("Tuple((i1, f4, f4))(f4[:], i4, f4, f4)", cache=True)
+def rsi_signal(closes, period, oversold, overbought):
+    """RSI sinyali: (sinyal kodu, rsi, güven)"""
+    rsi = rsi_last(closes, period)
+    if math.isnan(rsi):
+        return np.int8(SIGNAL_NONE), rsi, np.float32(0.0)
+
+    if rsi < oversold:
+        return np.int8(SIGNAL_BUY), rsi, np.float32(min(1.0, (oversold - rsi) / oversold))
+    if rsi > overbought:
+        return np.int8(SIGNAL_SELL), rsi, np.float32(min(1.0, (rsi - overbought) / (100.0 - overbought)))
+    return np.int8(SIGNAL_NONE), rsi, np.float32(0.0)
+
+
+@njit("f4(f4[:], i4)", cache=True)
+def sma_last(closes, period):
+    """Son 'period' kapanışın basit ortalaması; yetersiz veri varsa 0.0"""
+    n = closes.shape[0]
+    if period <= 0 or n < period:
+        return 0.0
+
+    total = 0.0
+    for i in range(n - period, n):
+        total += closes[i]
+    return total / period
+
+
+@njit("f4[:](f4[:], i4)", cache=True)
+def ema_series(data, period):
+    """İlk değeri SMA olan EMA serisi (uzunluk: len(data) - period + 1)"""
+    n = data.shape[0]
+    if period <= 0 or n < period:
+        return np.empty(0, dtype=np.float32)
+
+    out = np.empty(n - period + 1, dtype=np.float32)
+    total = 0.0
+    for i in range(period):
+        total += data[i]
+    prev = total / period
+    out[0] = prev
+
+    multiplier = 2.0 / (period + 1)
+    for i in range(period, n):
+        prev = (data[i] - prev) * multiplier + prev
+        out[i - period + 1] = prev
+    return out
+
+
+@njit("Tuple((f4, f4, f4))(f4[:], i4, i4, i4)", cache=True)
+def macd_last(closes, fast_period, slow_period, signal_period):
+    """Son (MACD, sinyal, histogram) değerleri; yetersiz veri varsa NaN"""
+    nan = np.float32(math.nan)
+    n = closes.shape[0]
+    if n < slow_period + signal_period:
+        return nan, nan, nan
+
+    fast_ema = ema_series(closes, fast_period)
+    slow_ema = ema_series(closes, slow_period)
+
+    # Seriler sondan hizalanır
+    min_len = min(fast_ema.shape[0], slow_ema.shape[0])
+    if min_len < signal_period:
+        return nan, nan, nan
+
+    fast_off = fast_ema.shape[0] - min_len
+    slow_off = slow_ema.shape[0] - min_len
+    macd_values = np.empty(min_len, dtype=np.float32)
+    for i in range(min_len):
+        macd_values[i] = fast_ema[fast_off + i] - slow_ema[slow_off + i]
+
+    signal_values = ema_series(macd_values, signal_period)
+
+    macd_line = macd_values[min_len - 1]
+    signal_line = signal_values[signal_values.shape[0] - 1]
+    return macd_line, signal_line, macd_line - signal_line
+
+
+@njit("f4[:](f4[:, :], i4)", parallel=True, cache=True)
+def rsi_batch(closes, period):
+    """
+    Çoklu sembol RSI: closes (n_symbols, n_bars) matrisinin her satırı için son RSI.
+    Kısa seriler soldan NaN ile doldurulur; her satır ilk sonlu değerden başlar.
+    Semboller prange ile CPU çekirdeklerine dağıtılır.
+    """
+    n_symbols, n_bars = closes.shape
+    out = np.empty(n_symbols, dtype=np.float32)
+    for s in prange(n_symbols):
+        start = 0
+        while start < n_bars and not math.isfinite(closes[s, start]):
+            start += 1
+        out[s] = rsi_last(closes[s, start:], period)
+    return out
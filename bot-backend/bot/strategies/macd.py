@@ -6,8 +6,11 @@ MACD (Moving Average Convergence Divergence) Stratejisi
 ████████████████████████████████████████████████████████████████
 """
 
-from typing import List, Optional
+import math
+from typing import Optional
+import numpy as np
 from .base import BaseStrategy
+from .kernels import macd_last
 from ..config import BotConfig
 
 
@@ -25,10 +28,8 @@ class MACDStrategy(BaseStrategy):
         self.prev_macd = None
         self.prev_signal = None
 
-    def calculate(self, klines: List, config: BotConfig) -> Optional[str]:
+    def calculate(self, ohlcv: np.ndarray, closes: np.ndarray, config: BotConfig) -> Optional[str]:
         """MACD sinyali hesapla"""
-        closes = self._extract_closes(klines)
-
         if len(closes) < config.macd_slow + config.macd_signal:
             return None
 
@@ -71,7 +72,7 @@ class MACDStrategy(BaseStrategy):
 
     def _calculate_macd(
         self,
-        prices: List[float],
+        prices: np.ndarray,
         fast_period: int,
         slow_period: int,
         signal_period: int
@@ -83,40 +84,10 @@ class MACDStrategy(BaseStrategy):
         █  KENDİ MACD HESAPLAMA KODUNU BURAYA EKLEYEBİLİRSİN   █
         ████████████████████████████████████████████████████████
         """
-        if len(prices) < slow_period + signal_period:
-            return None, None, None
-
-        # EMA hesaplama fonksiyonu
-        def ema(data: List[float], period: int) -> List[float]:
-            multiplier = 2 / (period + 1)
-            ema_values = [sum(data[:period]) / period]  # İlk SMA
-
-            for price in data[period:]:
-                ema_values.append((price - ema_values[-1]) * multiplier + ema_values[-1])
-
-            return ema_values
+        # MACD Line = Fast EMA - Slow EMA, Signal Line = MACD'nin EMA'sı
+        macd_line, signal_line, histogram = macd_last(prices, fast_period, slow_period, signal_period)
 
-        # Fast ve Slow EMA
-        fast_ema = ema(prices, fast_period)
-        slow_ema = ema(prices, slow_period)
-
-        # MACD Line = Fast EMA - Slow EMA
-        # Uzunlukları eşitle
-        min_len = min(len(fast_ema), len(slow_ema))
-        macd_values = [
-            fast_ema[-(min_len - i)] - slow_ema[-(min_len - i)]
-            for i in range(min_len)
-        ]
-
-        if len(macd_values) < signal_period:
+        if math.isnan(macd_line):
             return None, None, None
 
-        # Signal Line = MACD'nin EMA'sı
-        signal_values = ema(macd_values, signal_period)
-
-        # Son değerler
-        macd_line = macd_values[-1]
-        signal_line = signal_values[-1]
-        histogram = macd_line - signal_line
-
         return macd_line, signal_line, histogram
@@ -6,8 +6,11 @@ RSI (Relative Strength Index) Stratejisi
 ████████████████████████████████████████████████████████████████
 """
 
-from typing import List, Optional
+import math
+from typing import Optional
+import numpy as np
 from .base import BaseStrategy
+from .kernels import rsi_last, rsi_signal, SIGNAL_BUY, SIGNAL_SELL
 from ..config import BotConfig
 
 
@@ -23,33 +26,33 @@ class RSIStrategy(BaseStrategy):
         super().__init__()
         self.name = "rsi"
 
-    def calculate(self, klines: List, config: BotConfig) -> Optional[str]:
+    def calculate(self, ohlcv: np.ndarray, closes: np.ndarray, config: BotConfig) -> Optional[str]:
         """RSI sinyali hesapla"""
-        closes = self._extract_closes(klines)
-
         if len(closes) < config.rsi_period + 1:
             return None
 
-        # RSI hesapla
-        rsi = self._calculate_rsi(closes, config.rsi_period)
-
-        if rsi is None:
-            return None
+        # RSI ve sinyal tek bir derlenmiş çağrıda hesaplanır
+        signal, rsi, confidence = rsi_signal(
+            closes,
+            config.rsi_period,
+            float(config.rsi_oversold),
+            float(config.rsi_overbought)
+        )
 
         # Sinyal üret
-        if rsi < config.rsi_oversold:
+        if signal == SIGNAL_BUY:
             self.last_reason = f"RSI ({rsi:.1f}) aşırı satım bölgesinde (< {config.rsi_oversold})"
-            self.confidence = min(1.0, (config.rsi_oversold - rsi) / config.rsi_oversold)
+            self.confidence = confidence
             return "BUY"
 
-        elif rsi > config.rsi_overbought:
+        elif signal == SIGNAL_SELL:
             self.last_reason = f"RSI ({rsi:.1f}) aşırı alım bölgesinde (> {config.rsi_overbought})"
-            self.confidence = min(1.0, (rsi - config.rsi_overbought) / (100 - config.rsi_overbought))
+            self.confidence = confidence
             return "SELL"
 
         return None
 
-    def _calculate_rsi(self, prices: List[float], period: int) -> Optional[float]:
+    def _calculate_rsi(self, prices: np.ndarray, period: int) -> Optional[float]:
         """
         RSI hesapla
 
@@ -57,27 +60,5 @@ class RSIStrategy(BaseStrategy):
         █  KENDİ RSI HESAPLAMA KODUNU BURAYA EKLEYEBİLİRSİN    █
         ████████████████████████████████████████████████████████
         """
-        if len(prices) < period + 1:
-            return None
-
-        # Fiyat değişimlerini hesapla
-        deltas = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
-
-        # Son 'period' kadar değişimi al
-        recent_deltas = deltas[-(period):]
-
-        # Kazançları ve kayıpları ayır
-        gains = [d if d > 0 else 0 for d in recent_deltas]
-        losses = [-d if d < 0 else 0 for d in recent_deltas]
-
-        # Ortalama kazanç ve kayıp
-        avg_gain = sum(gains) / period
-        avg_loss = sum(losses) / period
-
-        if avg_loss == 0:
-            return 100.0
-
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-
-        return rsi
+        rsi = rsi_last(prices, period)
+        return None if math.isnan(rsi) else rsi
@@ -6,8 +6,10 @@ SMA (Simple Moving Average) Crossover Stratejisi
 ████████████████████████████████████████████████████████████████
 """
 
-from typing import List, Optional
+from typing import Optional
+import numpy as np
 from .base import BaseStrategy
+from .kernels import sma_last
 from ..config import BotConfig
 
 
@@ -25,10 +27,8 @@ class SMAStrategy(BaseStrategy):
         self.prev_short_sma = None
         self.prev_long_sma = None
 
-    def calculate(self, klines: List, config: BotConfig) -> Optional[str]:
+    def calculate(self, ohlcv: np.ndarray, closes: np.ndarray, config: BotConfig) -> Optional[str]:
         """SMA crossover sinyali hesapla"""
-        closes = self._extract_closes(klines)
-
         if len(closes) < config.sma_long + 1:
             return None
 
@@ -62,7 +62,7 @@ class SMAStrategy(BaseStrategy):
 
         return signal
 
-    def _calculate_sma(self, prices: List[float], period: int) -> float:
+    def _calculate_sma(self, prices: np.ndarray, period: int) -> float:
         """
         Simple Moving Average hesapla
 
@@ -70,7 +70,4 @@ class SMAStrategy(BaseStrategy):
         █  KENDİ SMA HESAPLAMA KODUNU BURAYA EKLEYEBİLİRSİN    █
         ████████████████████████████████████████████████████████
         """
-        if len(prices) < period:
-            return 0.0
-
-        return sum(prices[-period:]) / period
+        return sma_last(prices, period)
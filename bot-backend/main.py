@@ -8,11 +8,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional, List
 import asyncio
-import json
+import orjson
 from datetime import datetime
 
 # Bot modüllerini import et
-from bot.manager import BotManager
+from bot.manager import BotManager, PRIORITY_STATUS
 from bot.config import BotConfig
 
 app = FastAPI(title="CryptoBot API", version="1.0.0")
@@ -33,6 +33,29 @@ bot_manager = BotManager()
 active_connections: List[WebSocket] = []
 
 
+def dumps_message(message: dict) -> str:
+    """
+    WebSocket mesajını orjson ile serialize et.
+    Frontend JSON.parse(event.data) kullandığı için text frame olarak gönderilir.
+    """
+    return orjson.dumps(message, option=orjson.OPT_NAIVE_UTC).decode()
+
+
+async def send_message(websocket: WebSocket, message: dict):
+    """Tek bir client'a mesaj gönder"""
+    await websocket.send_text(dumps_message(message))
+
+
+async def send_status(websocket: WebSocket, message_type: str):
+    """
+    Bot durumunu gönder.
+    Durum JSON'u bot_manager'da önbelleklenir; burada sadece zarf eklenir.
+    """
+    await websocket.send_text(
+        f'{{"type":"{message_type}","data":{bot_manager.get_status_json()}}}'
+    )
+
+
 # ============== Pydantic Modeller ==============
 
 class ApiCredentials(BaseModel):
@@ -55,6 +78,14 @@ class BotConfigRequest(BaseModel):
     sma_long: int = 50
 
 
+class ScanRequest(BaseModel):
+    symbols: List[str]
+    interval: str = "1h"
+    rsi_period: int = 14
+    rsi_oversold: int = 30
+    rsi_overbought: int = 70
+
+
 class BotStatusResponse(BaseModel):
     is_running: bool
     strategy: str
@@ -172,6 +203,26 @@ async def get_recent_signals(limit: int = 20):
     return {"signals": signals}
 
 
+@app.post("/api/scan")
+async def scan_symbols(request: ScanRequest):
+    """Birden çok sembol için anlık RSI sinyallerini getir"""
+    if not request.symbols:
+        raise HTTPException(status_code=400, detail="Sembol listesi boş")
+
+    scan_config = BotConfig(
+        interval=request.interval,
+        rsi_period=request.rsi_period,
+        rsi_oversold=request.rsi_oversold,
+        rsi_overbought=request.rsi_overbought,
+    )
+
+    results = await bot_manager.scan(request.symbols, scan_config)
+    if results is None:
+        raise HTTPException(status_code=400, detail="Önce Binance'e bağlanmalısınız")
+
+    return {"signals": results}
+
+
 @app.post("/api/bot/config")
 async def update_config(config: BotConfigRequest):
     """Bot ayarlarını güncelle (çalışırken)"""
@@ -208,30 +259,28 @@ async def websocket_endpoint(websocket: WebSocket):
 
     try:
         # İlk bağlantıda mevcut durumu gönder
-        status = bot_manager.get_status()
-        await websocket.send_json({
-            "type": "initial_status",
-            "data": status
-        })
+        await send_status(websocket, "initial_status")
 
         while True:
             # Client'tan mesaj bekle
             data = await websocket.receive_text()
-            message = json.loads(data)
+            message = orjson.loads(data)
 
             # Mesaj tipine göre işle
             if message.get("type") == "ping":
-                await websocket.send_json({"type": "pong"})
+                await send_message(websocket, {"type": "pong"})
 
             elif message.get("type") == "get_status":
-                status = bot_manager.get_status()
-                await websocket.send_json({
-                    "type": "status_update",
-                    "data": status
-                })
+                # Status ping'i düşük öncelikli; kuyruk yoğunsa atlanır
+                await bot_manager.schedule(
+                    PRIORITY_STATUS, "status",
+                    lambda ws=websocket: send_status(ws, "status_update")
+                )
 
     except WebSocketDisconnect:
-        active_connections.remove(websocket)
+        # broadcast_message hata veren bağlantıyı zaten çıkarmış olabilir
+        if websocket in active_connections:
+            active_connections.remove(websocket)
     except Exception as e:
         print(f"WebSocket error: {e}")
         if websocket in active_connections:
@@ -239,12 +288,25 @@ async def websocket_endpoint(websocket: WebSocket):
 
 
 async def broadcast_message(message: dict):
-    """Tüm bağlı WebSocket client'larına mesaj gönder"""
-    for connection in active_connections:
-        try:
-            await connection.send_json(message)
-        except:
-            pass
+    """
+    Tüm bağlı WebSocket client'larına mesaj gönder.
+    Gönderimler eşzamanlı yapılır; hata veren (kopmuş) bağlantılar listeden çıkarılır.
+    """
+    if not active_connections:
+        return
+
+    # Mesajı bir kez serialize et, her client'a aynı metni gönder
+    payload = dumps_message(message)
+    connections = list(active_connections)
+
+    results = await asyncio.gather(
+        *(connection.send_text(payload) for connection in connections),
+        return_exceptions=True
+    )
+
+    for connection, result in zip(connections, results):
+        if isinstance(result, Exception) and connection in active_connections:
+            active_connections.remove(connection)
 
 
 # Bot manager'ın sinyal callback'i
@@ -279,7 +341,7 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     print("CryptoBot API kapatılıyor...")
-    await bot_manager.stop()
+    await bot_manager.shutdown()
 
 
 if __name__ == "__main__":
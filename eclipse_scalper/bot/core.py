@@ -731,7 +731,7 @@ class EclipseEternal:
             pass
 
         try:
-            await save_brain(self.state)
+            await save_brain(self.state, durable=True)
         except Exception:
             pass
 
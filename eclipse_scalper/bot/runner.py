@@ -14,6 +14,7 @@ import sys
 import platform
 import argparse
 from datetime import datetime, timezone
+from dataclasses import fields, is_dataclass
 from hashlib import sha256
 import json
 from pathlib import Path
@@ -22,7 +23,7 @@ from typing import Optional, Awaitable, Callable, Any
 from utils.logging import log_core
 from bot.core import EclipseEternal
 import bot.core as core_mod
-from config.settings import Config, MicroConfig
+from config.settings import Config, micro_config
 
 RUNNER_VERSION = "cosmic-runner-ascendant-absolute-v4.9-2026-jan07"
 
@@ -322,7 +323,7 @@ async def run_bot(
         mode = "auto"
 
     if mode == "micro" or (mode == "auto" and float(equity or 0.0) < 100):
-        bot.cfg = MicroConfig()
+        bot.cfg = micro_config()
         chosen_mode = "micro"
         log_core.critical(f"MICRO CAPITAL ASCENDANT MODE ACTIVATED - Equity ${equity:.2f} - The blade rises from dust")
     elif mode == "production":
@@ -365,7 +366,14 @@ async def run_bot(
         pass
 
     # ---- Config fingerprint ----
-    config_hash = sha256(str(getattr(bot.cfg, "__dict__", {})).encode()).hexdigest()[:16]
+    # Config is slotted (no __dict__): hash the repr=True dataclass fields
+    # (repr=False fields like entry_params are derived, not settings).
+    # Not the old __dict__ text: field order and tuple-typed lists differ, so the hash changed once with this layout
+    if is_dataclass(bot.cfg):
+        cfg_fields = {f.name: getattr(bot.cfg, f.name) for f in fields(bot.cfg) if f.repr}
+    else:
+        cfg_fields = getattr(bot.cfg, "__dict__", {})
+    config_hash = sha256(str(cfg_fields).encode()).hexdigest()[:16]
     log_core.critical(f"CONFIG: {bot.cfg.CONFIG_VERSION} | HASH: {config_hash}...")
     log_core.critical(
         f"LEVERAGE: {bot.cfg.LEVERAGE}x | BASE RISK: {bot.cfg.MAX_RISK_PER_TRADE:.1%} | "
@@ -1,4 +1,4 @@
-# brain/persistence.py — ETERNAL BRAIN — IMMORTALITY LAYER — 2026 v4.5 (HARDENED)
+# brain/persistence.py — ETERNAL BRAIN — IMMORTALITY LAYER — 2026 v4.7 (HARDENED)
 # Patch vs your v4.4c:
 # - ✅ Canonical _symkey matches state.py (handles /USDT:USDT, /USDT, :USDT)
 # - ✅ Adds entry_watches (canonicalize + cap) for entry_watch.py persistence
@@ -6,16 +6,46 @@
 # - ✅ Normalizes/caps known_exit_order_ids deterministically
 # - ✅ streak_history always stored as primitives [iso, int, float]
 # - ✅ Keeps IO lock + atomic rollback write behavior
+# - ✅ save_brain: single canonicalize/primitive pass (no re-walk of sanitized state)
+# - ✅ msgspec.msgpack Encoder/Decoder singletons (same wire format as msgpack use_bin_type)
+# - ✅ Streaming save: msgpack chunks -> LZ4 frame compressor, both SHAs fed in the same pass
+# - ✅ Streaming load: LZ4 frame decompressed in slices, payload SHA fed per output chunk
+# - ✅ _symkey memoized (symbol alphabet is bounded, hit rate ~100%)
+# - ✅ _symkey: one replace + one translate instead of a 5-step replace chain
+# - ✅ v4.6 disk layout: positions stored columnar (positions_soa); legacy AoS still loads
+# - ✅ Load fast-path: current-version files marked canonical skip re-canonicalization
+# - ✅ Save CPU work (encode + lz4 + sha) runs in a worker thread; loop only snapshots + writes
+# - ✅ File I/O via asyncio.to_thread over stdlib (write+flush+fsync in one hop); aiofiles dropped
+# - ✅ fsync coalescing: tmp/dir fsync only every FSYNC_MIN_INTERVAL_S / FSYNC_EVERY_N saves or durable=True
+# - ✅ entry_watches cap: heapq.nlargest partial select instead of a full sort
+# - ✅ _canon_map_keys fast path: already-canonical maps are copied, not rebuilt
+# - ✅ LZ4 frame: content/block checksums off + fast level pinned (SHA-256 already covers integrity)
+# - ✅ Backup rotation overlaps the tmp write (disjoint files, two worker threads)
+# - ✅ main->bak1 via hardlink (copyfile fallback): main never disappears mid-save
+# - ✅ _to_primitive_safe dispatches type(x).__msgpack__ (Position/PsycheState) before vars()
+# - ✅ v4.7 disk layout: confidence data (SoA confidence column + entry_confidence_history) stored FP32
+# - ✅ Write-elide: unchanged content (everything but the save timestamp) skips the disk write
+# - ✅ Heal-forward rewrites the verified backup bytes under the held lock (no re-encode, no
+#      re-entrant save_brain -> fixes the load->save _IO_LOCK deadlock)
+# - ✅ Save encoder writes value chunks into one reused bytearray (Encoder.encode_into)
+# - ✅ Envelope: fixed struct header (magic + 2 hex SHAs + blob length); legacy msgpack envelope still loads
+# - ✅ Save snapshot = PsycheState.serialize_to_bytes(); decode + canonicalize moved into the worker thread
+# - ✅ _safe_float/_safe_int: exact float/int/None fast paths ahead of the try/float() fallback
 
 from __future__ import annotations
 
 import os
-import msgpack
+import sys
+import shutil
+import struct
+import functools
+import msgspec
 import lz4.frame
-import aiofiles
 import time
 import hashlib
+import heapq
 import asyncio
+from array import array
 from datetime import date, datetime
 from typing import Optional, Dict, Any, List, Tuple, Union, Callable
 
@@ -24,7 +54,7 @@ from brain.state import PsycheState
 
 BRAIN_PATH = os.path.expanduser("~/.blade_eternal.brain.lz4")
 
-PERSISTENCE_VERSION = "god-emperor-immortal-v4.5-2026-jan06"
+PERSISTENCE_VERSION = "god-emperor-immortal-v4.7-2026-oct15"
 
 ACCEPTED_VERSIONS = {
     "god-emperor-immortal-v1.0-2025-dec26",
@@ -34,6 +64,8 @@ ACCEPTED_VERSIONS = {
     "god-emperor-immortal-v4.3-2026-jan06",
     "god-emperor-immortal-v4.4-2026-jan06",
     "god-emperor-immortal-v4.4c-2026-jan06",
+    "god-emperor-immortal-v4.5-2026-jan06",
+    "god-emperor-immortal-v4.6-2026-oct15",
     PERSISTENCE_VERSION,
 }
 
@@ -44,6 +76,44 @@ _disk_failed: bool = False
 
 _IO_LOCK = asyncio.Lock()
 
+# fsync coalescing: routine saves skip the journal barrier unless the window elapsed,
+# N saves went by unsynced, or the caller asks for durable=True (shutdown / emergency).
+FSYNC_MIN_INTERVAL_S = 5.0
+FSYNC_EVERY_N = 8
+_last_fsync_ts: float = 0.0
+_saves_since_fsync: int = 0
+
+# Write-elide: SHA of the last content written to BRAIN_PATH (payload minus volatile keys)
+_ENVELOPE_VOLATILE_KEYS = frozenset(("timestamp",))
+_last_content_sha: Optional[str] = None
+
+# msgpack codec (C-level, reused across calls). Wire format matches
+# msgpack.packb(use_bin_type=True) / unpackb(raw=False): bytes<->bin, str<->str.
+_ENC = msgspec.msgpack.Encoder()
+_DEC = msgspec.msgpack.Decoder()
+
+# Scratch buffer for save-side value chunks (encode_into grows it once, then reuses it).
+# Only touched by _build_envelope, which runs one at a time under _IO_LOCK.
+# Floats stay 8-byte: a single-float encoder would cost epoch timestamps ~2 min of precision;
+# FP32 is applied per-column where safe (see _SOA_F32_COLS).
+_ENC_BUF = bytearray()
+
+# Envelope framing: MAGIC + <checksum hex, payload_sha hex, blob length> + blob.
+# Legacy envelopes are a msgpack fixmap (first byte 0x8N), so the magic never collides.
+_ENVELOPE_MAGIC = b"EBRN\x01"
+_ENVELOPE_HEADER = struct.Struct("<64s64sI")
+
+# LZ4 frame settings: the envelope SHA-256 covers integrity, so no XXH32 frame/block
+# checksums; level 0 = fast mode. Pinned explicitly rather than trusting library defaults.
+_LZ4_FRAME_KW = {
+    "compression_level": 0,
+    "content_checksum": False,
+    "block_checksum": False,
+}
+
+# Slice size fed to the LZ4 frame decompressor on load
+_DECOMPRESS_FEED_BYTES = 1 << 20
+
 # Caps (bloat control)
 KNOWN_EXIT_IDS_CAP = 50_000
 ENTRY_WATCHES_CAP = 500
@@ -56,7 +126,39 @@ def _sha256_hex(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
 
 
+def _decompress_with_sha(blob: bytes) -> Tuple[bytes, str]:
+    """
+    Decompress an LZ4 frame in slices and hash each output chunk as it is produced,
+    so the payload SHA needs no second pass over the decompressed buffer.
+    """
+    h = hashlib.sha256()
+    parts: List[bytes] = []
+    decompressor = lz4.frame.LZ4FrameDecompressor()
+    mv = memoryview(blob)
+    for off in range(0, len(mv), _DECOMPRESS_FEED_BYTES):
+        chunk = decompressor.decompress(mv[off:off + _DECOMPRESS_FEED_BYTES])
+        if chunk:
+            h.update(chunk)
+            parts.append(chunk)
+        if decompressor.eof:
+            break
+    if not decompressor.eof:
+        raise ValueError("truncated LZ4 frame")
+    return b"".join(parts), h.hexdigest()
+
+
 def _safe_float(x, default: float = 0.0) -> float:
+    # Fast paths: validated fields are exact floats/ints; None is the usual "missing"
+    t = type(x)
+    if t is float:
+        return x if x == x else default  # NaN
+    if t is int:
+        try:
+            return float(x)
+        except OverflowError:
+            return default
+    if x is None:
+        return default
     try:
         v = float(x)
         if v != v:  # NaN
@@ -67,6 +169,10 @@ def _safe_float(x, default: float = 0.0) -> float:
 
 
 def _safe_int(x, default: int = 0) -> int:
+    if type(x) is int:
+        return x if x >= 0 else default
+    if x is None:
+        return default
     try:
         v = int(x)
         return v if v >= 0 else default
@@ -105,82 +211,125 @@ _Prim = Union[None, bool, int, float, str, bytes]
 _MsgpackSafe = Union[_Prim, Dict[str, Any], List[Any]]
 
 
-def _to_primitive_safe(x: Any, *, _depth: int = 0, _max_depth: int = 40) -> _MsgpackSafe:
+_PRIM_TYPES = frozenset((type(None), bool, int, float, str, bytes))
+
+
+def _to_primitive_safe(x: Any, *, _max_depth: int = 40) -> _MsgpackSafe:
     """
     Convert arbitrary objects into msgpack-safe primitives.
     - dict keys -> str
     - set/tuple -> list
     - date/datetime -> isoformat string
+
+    Iterative: a worklist of (parent, key, value, depth) fills a shadow tree,
+    so large maps cost no Python call frame per node.
     """
-    if _depth > _max_depth:
-        return str(x)
+    root: List[Any] = [None]
+    stack: List[Tuple[Any, Any, Any, int]] = [(root, 0, x, 0)]
+    pop = stack.pop
+    push = stack.append
 
-    if x is None or isinstance(x, (bool, int, float, str, bytes)):
-        return x
+    while stack:
+        parent, key, v, depth = pop()
 
-    if isinstance(x, (date, datetime)):
-        try:
-            return x.isoformat()
-        except Exception:
-            return str(x)
+        if depth > _max_depth:
+            parent[key] = str(v)
+            continue
 
-    if isinstance(x, set):
-        try:
-            return [_to_primitive_safe(v, _depth=_depth + 1) for v in list(x)]
-        except Exception:
-            return []
+        t = type(v)
+        if t in _PRIM_TYPES:
+            parent[key] = v
+            continue
 
-    if isinstance(x, tuple):
-        try:
-            return [_to_primitive_safe(v, _depth=_depth + 1) for v in list(x)]
-        except Exception:
-            return []
+        if t is dict or (t is not list and isinstance(v, dict)):
+            out: Dict[str, Any] = {}
+            parent[key] = out
+            items = []
+            for k, cv in v.items():
+                try:
+                    ks = str(k)
+                except Exception:
+                    ks = "<?>"
+                out[ks] = None
+                items.append((ks, cv))
+            # reversed -> popped in insertion order, so a later duplicate str key still wins
+            for ks, cv in reversed(items):
+                push((out, ks, cv, depth + 1))
+            continue
+
+        if t is list or t is tuple or t is set or isinstance(v, (list, tuple, set)):
+            seq = list(v)
+            lst: List[Any] = [None] * len(seq)
+            parent[key] = lst
+            for i in range(len(seq) - 1, -1, -1):
+                push((lst, i, seq[i], depth + 1))
+            continue
 
-    if isinstance(x, list):
-        return [_to_primitive_safe(v, _depth=_depth + 1) for v in x]
+        if isinstance(v, (bool, int, float, str, bytes)):
+            parent[key] = v
+            continue
 
-    if isinstance(x, dict):
-        out: Dict[str, Any] = {}
-        for k, v in x.items():
+        if isinstance(v, (date, datetime)):
             try:
-                ks = str(k)
+                parent[key] = v.isoformat()
             except Exception:
-                ks = "<?>"
-            out[ks] = _to_primitive_safe(v, _depth=_depth + 1)
-        return out
+                parent[key] = str(v)
+            continue
 
-    try:
-        d = vars(x)
+        # Known types (Position, PsycheState) expose __msgpack__ -> primitive dict.
+        # vars() stays as the escape hatch for anything else that lands in free-form maps.
+        to_msgpack = getattr(t, "__msgpack__", None)
+        if to_msgpack is not None:
+            try:
+                d = to_msgpack(v)
+            except Exception:
+                d = None
+        else:
+            try:
+                d = vars(v)
+            except Exception:
+                d = None
         if isinstance(d, dict):
-            return _to_primitive_safe(d, _depth=_depth + 1)
-    except Exception:
-        pass
+            push((parent, key, d, depth + 1))
+            continue
+
+        parent[key] = str(v)
 
-    return str(x)
+    return root[0]
 
 
 # -----------------------
 # Canonical symbol law (MATCHES brain/state.py)
 # -----------------------
-def _symkey(sym: Any) -> str:
-    if sym is None:
-        return ""
-    try:
-        s = str(sym).strip().upper()
-    except Exception:
-        return ""
+# '/USDT' -> 'USDT' and ':USDT' -> 'USDT' are just separator drops, so the only
+# real substitution is the settle suffix; every remaining ':' / '/' is removed.
+_SETTLE_SUFFIX = "/USDT:USDT"
+_DROP_SEPARATORS = str.maketrans("", "", ":/")
+
+
+@functools.lru_cache(maxsize=4096)
+def _symkey_str(raw: str) -> str:
+    s = raw.strip().upper()
     if not s:
         return ""
 
-    s = s.replace("/USDT:USDT", "USDT").replace("/USDT", "USDT")
-    s = s.replace(":USDT", "USDT").replace(":", "")
-    s = s.replace("/", "")
+    s = s.replace(_SETTLE_SUFFIX, "USDT").translate(_DROP_SEPARATORS)
 
     if s.endswith("USDTUSDT"):
         s = s[:-4]
     return s
 
 
+def _symkey(sym: Any) -> str:
+    if sym is None:
+        return ""
+    try:
+        raw = str(sym)
+    except Exception:
+        return ""
+    return _symkey_str(raw)
+
+
 def _merge_max(a: Any, b: Any) -> Any:
     try:
         fa = _safe_float(a, 0.0)
@@ -207,6 +356,12 @@ def _canon_map_keys(m: Any, *, merge_fn: Optional[Callable[[Any, Any], Any]] = N
     out: Dict[str, Any] = {}
     if not isinstance(m, dict):
         return out
+
+    # Steady state (file written canonical): every key maps to itself -> no collisions possible.
+    # All keys are checked (not a sample); _symkey_str is memoized so this is a cache hit per key.
+    if all(type(k) is str and k and _symkey_str(k) == k for k in m):
+        return dict(m)
+
     for k, v in m.items():
         ck = _symkey(k)
         if not ck:
@@ -304,8 +459,13 @@ def _canon_entry_watches_map(m: Any) -> Dict[str, Dict[str, Any]]:
     # deterministic cap: keep newest
     try:
         if len(out) > ENTRY_WATCHES_CAP:
-            items = sorted(out.items(), key=lambda kv: _safe_float(kv[1].get("created_ts", 0.0), 0.0))
-            out = dict(items[-ENTRY_WATCHES_CAP:])
+            # (created_ts, insertion idx): same survivors + order as a stable ascending sort tail
+            top = heapq.nlargest(
+                ENTRY_WATCHES_CAP,
+                enumerate(out.items()),
+                key=lambda ikv: (_safe_float(ikv[1][1].get("created_ts", 0.0), 0.0), ikv[0]),
+            )
+            out = dict(kv for _, kv in reversed(top))
     except Exception:
         pass
 
@@ -391,6 +551,175 @@ def _canonicalize_payload_state(s: Dict[str, Any]) -> Dict[str, Any]:
     return out
 
 
+# -----------------------
+# Positions SoA (disk layout since v4.6)
+# -----------------------
+# Columnar layout: one list/packed array per field instead of one map per position.
+# Numeric columns are little-endian array('d') / array('q') bytes -> one msgpack bin each.
+# v4.7+: columns in _SOA_F32_COLS are array('f'); the soa["f32"] list names them for the reader.
+_SOA_FLOAT_COLS = ("size", "entry_price", "atr", "entry_ts", "confidence", "last_breakeven_move")
+_SOA_F32_COLS = ("confidence",)
+_SOA_INT_COLS = ("leverage",)
+_SOA_FLAG_BITS = (("trailing_active", 1), ("breakeven_moved", 2))
+_SOA_KNOWN_FIELDS = frozenset(
+    _SOA_FLOAT_COLS + _SOA_INT_COLS + tuple(f for f, _ in _SOA_FLAG_BITS)
+    + ("symbol", "side", "hard_stop_order_id")
+)
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _pack_array(typecode: str, values: List[Any]) -> bytes:
+    a = array(typecode, values)
+    if not _LITTLE_ENDIAN:
+        a.byteswap()
+    return a.tobytes()
+
+
+def _unpack_array(typecode: str, b: Any, n: int) -> List[Any]:
+    a = array(typecode)
+    if isinstance(b, (bytes, bytearray)):
+        a.frombytes(bytes(b))
+        if not _LITTLE_ENDIAN:
+            a.byteswap()
+    out = a.tolist()
+    if len(out) != n:
+        raise ValueError(f"SoA column length {len(out)} != {n}")
+    return out
+
+
+# -----------------------
+# FP32 quantization (confidence data only)
+# -----------------------
+# Confidences are [0, 1] scores: FP32 (~7 significant digits) is far below their noise.
+# Prices, sizes, money and timestamps stay FP64 — an epoch second needs ~10 digits.
+def _unpack_f32(b: Any, n: int) -> List[float]:
+    # %.7g snaps the FP32 value back to the short decimal it was written from (0.8, not 0.800000011920929)
+    return [float("%.7g" % x) for x in _unpack_array("f", b, n)]
+
+
+def _conf_history_to_disk(m: Any) -> Tuple[Dict[str, bytes], Dict[str, Any]]:
+    """entry_confidence_history -> ({sym: f32 bytes}, leftovers that are not plain float lists)."""
+    packed: Dict[str, bytes] = {}
+    rest: Dict[str, Any] = {}
+    if not isinstance(m, dict):
+        return packed, rest
+    for k, hist in m.items():
+        if isinstance(hist, list) and all(type(x) is float or type(x) is int for x in hist):
+            try:
+                packed[k] = _pack_array("f", hist)
+                continue
+            except Exception:
+                pass
+        rest[k] = hist
+    return packed, rest
+
+
+def _conf_history_from_disk(packed: Any) -> Dict[str, List[float]]:
+    out: Dict[str, List[float]] = {}
+    if not isinstance(packed, dict):
+        return out
+    for k, b in packed.items():
+        if isinstance(b, (bytes, bytearray)) and len(b) % 4 == 0:
+            out[str(k)] = _unpack_f32(b, len(b) // 4)
+    return out
+
+
+def _positions_to_soa(pos: Dict[str, Any]) -> Dict[str, Any]:
+    """Canonical AoS positions map -> columnar dict (non-dict entries are dropped)."""
+    keys: List[str] = []
+    rows: List[Dict[str, Any]] = []
+    for k, pv in pos.items():
+        if isinstance(pv, dict):
+            keys.append(k)
+            rows.append(pv)
+
+    soa: Dict[str, Any] = {"keys": keys, "f32": list(_SOA_F32_COLS)}
+    for col in _SOA_FLOAT_COLS:
+        tc = "f" if col in _SOA_F32_COLS else "d"
+        soa[col] = _pack_array(tc, [_safe_float(r.get(col), 0.0) for r in rows])
+    for col in _SOA_INT_COLS:
+        soa[col] = _pack_array("q", [_safe_int(r.get(col), 0) for r in rows])
+
+    soa["side"] = [str(r.get("side") or "long") for r in rows]
+    soa["hard_stop_order_id"] = [
+        str(r["hard_stop_order_id"]) if r.get("hard_stop_order_id") is not None else None for r in rows
+    ]
+
+    flags = bytearray(len(rows))
+    for i, r in enumerate(rows):
+        f = 0
+        for name, bit in _SOA_FLAG_BITS:
+            if r.get(name):
+                f |= bit
+        flags[i] = f
+    soa["flags"] = bytes(flags)
+
+    # Unknown per-position fields survive as a sparse side-table
+    extra = {k: {f: v for f, v in r.items() if f not in _SOA_KNOWN_FIELDS} for k, r in zip(keys, rows)}
+    extra = {k: e for k, e in extra.items() if e}
+    if extra:
+        soa["extra"] = extra
+
+    return soa
+
+
+def _positions_from_soa(soa: Any) -> Dict[str, Any]:
+    """Columnar dict -> AoS positions map (inverse of _positions_to_soa)."""
+    if not isinstance(soa, dict):
+        return {}
+    keys = soa.get("keys")
+    if not isinstance(keys, list):
+        return {}
+    n = len(keys)
+
+    f32 = soa.get("f32") if isinstance(soa.get("f32"), list) else ()  # absent in v4.6 files
+    cols: Dict[str, List[Any]] = {}
+    for col in _SOA_FLOAT_COLS:
+        if col in f32:
+            cols[col] = _unpack_f32(soa.get(col), n)
+        else:
+            cols[col] = _unpack_array("d", soa.get(col), n)
+    for col in _SOA_INT_COLS:
+        cols[col] = _unpack_array("q", soa.get(col), n)
+
+    sides = soa.get("side") if isinstance(soa.get("side"), list) else ["long"] * n
+    stops = soa.get("hard_stop_order_id") if isinstance(soa.get("hard_stop_order_id"), list) else [None] * n
+    flags = soa.get("flags") if isinstance(soa.get("flags"), (bytes, bytearray)) else bytes(n)
+    extra = soa.get("extra") if isinstance(soa.get("extra"), dict) else {}
+    if len(sides) != n or len(stops) != n or len(flags) != n:
+        raise ValueError("SoA column length mismatch")
+
+    out: Dict[str, Any] = {}
+    for i, k in enumerate(keys):
+        pv: Dict[str, Any] = {"symbol": k, "side": sides[i], "hard_stop_order_id": stops[i]}
+        for col, values in cols.items():
+            pv[col] = values[i]
+        for name, bit in _SOA_FLAG_BITS:
+            pv[name] = bool(flags[i] & bit)
+        e = extra.get(k)
+        if isinstance(e, dict):
+            for f, v in e.items():
+                pv.setdefault(f, v)
+        out[str(k)] = pv
+    return out
+
+
+def _payload_to_disk(payload_state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Swap AoS positions for the columnar disk layout and FP32-pack confidence
+    histories (shallow copy).
+    payload_state comes from _state_to_payload/_snapshot_to_payload (already canonical) -> mark it so.
+    """
+    out = dict(payload_state)
+    pos = out.pop("positions", None)
+    out["positions_soa"] = _positions_to_soa(pos if isinstance(pos, dict) else {})
+    packed, rest = _conf_history_to_disk(out.get("entry_confidence_history"))
+    out["entry_confidence_history"] = rest
+    out["entry_confidence_history_f32"] = packed
+    out["canonical"] = True
+    return out
+
+
 # -----------------------
 # Payload shaping
 # -----------------------
@@ -479,12 +808,61 @@ def _state_to_payload(state: PsycheState) -> Dict[str, Any]:
     return payload  # type: ignore[return-value]
 
 
+def _state_snapshot(state: PsycheState) -> Union[bytes, Dict[str, Any]]:
+    """
+    Detached save snapshot taken on the loop: serialize_to_bytes() (one C encode pass over
+    the live state), or the _state_to_payload dict if the state cannot be encoded directly.
+    """
+    try:
+        snap = state.serialize_to_bytes()
+        if isinstance(snap, bytes):
+            return snap
+    except Exception:
+        pass
+    return _state_to_payload(state)
+
+
+def _snapshot_to_payload(snap: bytes, schema_version: Any) -> Dict[str, Any]:
+    """serialize_to_bytes() output -> canonical payload_state (worker-thread side)."""
+    payload = _DEC.decode(snap)
+    if not isinstance(payload, dict):
+        raise ValueError("state snapshot root is not a map")
+    payload.setdefault("schema_version", _safe_int(schema_version, 1))
+    payload = _canonicalize_payload_state(payload)
+    return _to_primitive_safe(payload)  # type: ignore[return-value]
+
+
 def _migrate_payload_state(payload: Dict[str, Any], persistence_version: str) -> Dict[str, Any]:
     """
     Migration hook for payload dict before PsycheState.from_loaded().
     """
     s = dict(payload or {})
 
+    # v4.6+: columnar positions on disk -> AoS map (legacy files already carry "positions")
+    if "positions_soa" in s:
+        s["positions"] = _positions_from_soa(s.pop("positions_soa"))
+
+    # v4.7+: FP32-packed confidence histories (leftovers stay under the plain key)
+    if "entry_confidence_history_f32" in s:
+        ech = s.get("entry_confidence_history")
+        merged = dict(ech) if isinstance(ech, dict) else {}
+        merged.update(_conf_history_from_disk(s.pop("entry_confidence_history_f32")))
+        s["entry_confidence_history"] = merged
+
+    # Written by this version's save_brain -> already canonical + primitive-safe on disk
+    canonical = s.pop("canonical", None) is True
+    if canonical and persistence_version == PERSISTENCE_VERSION:
+        for k, default in (
+            ("positions", {}), ("blacklist", {}), ("blacklist_reason", {}),
+            ("consecutive_losses", {}), ("last_exit_time", {}), ("known_exit_order_ids", []),
+            ("symbol_performance", {}), ("entry_confidence_history", {}),
+            ("funding_rate_snapshot", {}), ("entry_watches", {}), ("run_context", {}),
+            ("streak_history", []),
+        ):
+            s.setdefault(k, default)
+        s.setdefault("schema_version", 1)
+        return s
+
     compat_map = s.get("compat_map")
     if isinstance(compat_map, dict):
         s = _apply_compat_map(s, compat_map)
@@ -551,17 +929,103 @@ def _migrate_payload_state(payload: Dict[str, Any], persistence_version: str) ->
 # -----------------------
 # Envelope IO
 # -----------------------
-def _pack_envelope(payload_bytes: bytes) -> bytes:
-    compressed = lz4.frame.compress(payload_bytes)
-    checksum = _sha256_hex(compressed)
-    payload_sha = _sha256_hex(payload_bytes)
-    env = {"checksum": checksum, "payload_sha": payload_sha, "blob": compressed}
-    return msgpack.packb(env, use_bin_type=True)
+def _msgpack_map_header(n: int) -> bytes:
+    if n < 16:
+        return bytes((0x80 | n,))
+    if n < 0x10000:
+        return b"\xde" + n.to_bytes(2, "big")
+    return b"\xdf" + n.to_bytes(4, "big")
+
+
+def _iter_msgpack_chunks(obj: Any, depth: int) -> Any:
+    """
+    Yield the msgpack encoding of obj in pieces (map header, key, value, ...).
+    Dicts are split down to `depth` levels; concatenated output is byte-identical
+    to _ENC.encode(obj). Keys must already be str (see _to_primitive_safe).
+    Value chunks are yielded as the shared _ENC_BUF: consume before advancing.
+    """
+    if depth <= 0 or type(obj) is not dict:
+        _ENC.encode_into(obj, _ENC_BUF)
+        yield _ENC_BUF
+        return
+    yield _msgpack_map_header(len(obj))
+    for k, v in obj.items():
+        yield _ENC.encode(k)
+        yield from _iter_msgpack_chunks(v, depth - 1)
+
+
+def _pack_envelope(data: Dict[str, Any]) -> Tuple[bytes, str]:
+    """
+    Single pass: msgpack chunks -> payload SHA + LZ4 frame compressor -> blob SHA.
+    The full uncompressed payload is never materialized as one buffer.
+    Also returns the content SHA (same chunks minus _ENVELOPE_VOLATILE_KEYS) for write-elide.
+    """
+    h_payload = hashlib.sha256()
+    h_content = hashlib.sha256()
+    h_blob = hashlib.sha256()
+    parts: List[bytes] = []
+
+    def _emit(b: bytes) -> None:
+        if b:
+            h_blob.update(b)
+            parts.append(b)
+
+    compressor = lz4.frame.LZ4FrameCompressor(**_LZ4_FRAME_KW)
+    _emit(compressor.begin())
+
+    def _feed(chunk: bytes, content: bool) -> None:
+        h_payload.update(chunk)
+        if content:
+            h_content.update(chunk)
+        _emit(compressor.compress(chunk))
+
+    # Top level unrolled (same bytes as _iter_msgpack_chunks(data, depth=3)) to tag volatile keys
+    _feed(_msgpack_map_header(len(data)), True)
+    for k, v in data.items():
+        content = k not in _ENVELOPE_VOLATILE_KEYS
+        _feed(_ENC.encode(k), content)
+        for chunk in _iter_msgpack_chunks(v, depth=2):
+            _feed(chunk, content)
+    _emit(compressor.flush())
+
+    header = _ENVELOPE_HEADER.pack(
+        h_blob.hexdigest().encode("ascii"),
+        h_payload.hexdigest().encode("ascii"),
+        sum(len(p) for p in parts),
+    )
+    return b"".join([_ENVELOPE_MAGIC, header, *parts]), h_content.hexdigest()
 
 
 def _unpack_envelope(raw: bytes) -> Optional[Dict[str, Any]]:
+    if raw[:len(_ENVELOPE_MAGIC)] == _ENVELOPE_MAGIC:
+        return _unpack_envelope_framed(raw)
+    return _unpack_envelope_legacy(raw)
+
+
+def _unpack_envelope_framed(raw: bytes) -> Optional[Dict[str, Any]]:
+    off = len(_ENVELOPE_MAGIC)
     try:
-        env = msgpack.unpackb(raw, raw=False)
+        checksum_b, payload_sha_b, n = _ENVELOPE_HEADER.unpack_from(raw, off)
+    except struct.error:
+        return None
+
+    off += _ENVELOPE_HEADER.size
+    if len(raw) - off != n:
+        return None
+
+    blob = raw[off:]
+    checksum = checksum_b.decode("ascii", errors="ignore")
+    if _sha256_hex(blob) != checksum:
+        return None
+
+    payload_sha = payload_sha_b.decode("ascii", errors="ignore") or None
+    return {"blob": blob, "checksum": checksum, "payload_sha": payload_sha}
+
+
+def _unpack_envelope_legacy(raw: bytes) -> Optional[Dict[str, Any]]:
+    """Pre-v4.6 msgpack envelope {checksum, payload_sha, blob}."""
+    try:
+        env = _DEC.decode(raw)
     except Exception:
         return None
 
@@ -584,7 +1048,8 @@ def _unpack_envelope(raw: bytes) -> Optional[Dict[str, Any]]:
     if not isinstance(blob, (bytes, bytearray)):
         return None
 
-    blob = bytes(blob)
+    if type(blob) is not bytes:
+        blob = bytes(blob)
     if _sha256_hex(blob) != checksum:
         return None
 
@@ -618,52 +1083,87 @@ def _rotate_backups():
                 pass
 
 
-async def _atomic_write(path: str, data: bytes) -> None:
-    """
-    Atomic-ish write with rollback:
-      1) write tmp + fsync tmp
-      2) rotate backups
-      3) move main->bak1 (if exists)
-      4) move tmp->main
-      5) fsync dir best-effort
-    """
-    tmp = path + ".tmp"
+def _write_bytes(path: str, data: bytes, fsync: bool = True) -> None:
+    """Blocking write + flush (+ fsync) (run via asyncio.to_thread). fsync is best-effort."""
+    with open(path, "wb") as f:
+        f.write(data)
+        f.flush()
+        if fsync:
+            try:
+                os.fsync(f.fileno())
+            except Exception:
+                pass
+
+
+def _read_bytes(path: str) -> bytes:
+    """Blocking whole-file read (run via asyncio.to_thread)."""
+    with open(path, "rb") as f:
+        return f.read()
 
-    async with aiofiles.open(tmp, "wb") as f:
-        await f.write(data)
-        try:
-            await f.flush()
-        except Exception:
-            pass
 
+def _link_backup(src: str, dst: str) -> None:
+    """
+    dst becomes a second name for src's inode (metadata-only, src stays in place).
+    Falls back to a byte copy on filesystems without hardlinks. Best-effort.
+    """
     try:
-        fd = os.open(tmp, os.O_RDONLY)
-        try:
-            os.fsync(fd)
-        finally:
-            os.close(fd)
+        if os.path.lexists(dst):
+            os.unlink(dst)
+    except Exception:
+        pass
+    try:
+        os.link(src, dst)
+        return
+    except Exception:
+        pass
+    try:
+        shutil.copyfile(src, dst)
     except Exception:
         pass
 
-    _rotate_backups()
 
-    bak1 = f"{path}.bak1"
-    main_existed = os.path.exists(path)
+def _fsync_due(force_fsync: bool) -> bool:
+    if force_fsync:
+        return True
+    if _saves_since_fsync + 1 >= FSYNC_EVERY_N:
+        return True
+    return (time.time() - _last_fsync_ts) > FSYNC_MIN_INTERVAL_S
 
-    if main_existed:
-        try:
-            os.replace(path, bak1)
-        except Exception:
-            pass
+
+async def _atomic_write(path: str, data: bytes, force_fsync: bool = False) -> None:
+    """
+    Atomic-ish write with rollback:
+      1) write tmp (+ fsync tmp when due) || 2) rotate backups — concurrently
+      3) hardlink main->bak1 (if exists; copy if the FS has no hardlinks)
+      4) move tmp->main (atomic replace; main is never absent)
+      5) fsync dir best-effort (when due)
+
+    Skipped fsyncs only widen the crash window; rename still keeps main whole,
+    and .bakN files cover a torn write on resurrection.
+    """
+    global _last_fsync_ts, _saves_since_fsync
+
+    tmp = path + ".tmp"
+    do_fsync = _fsync_due(force_fsync)
+
+    # .tmp and .bak2..N are disjoint; main/.bak1 are untouched until both finish.
+    # return_exceptions: rotation always completes before a write failure propagates.
+    write_res, _ = await asyncio.gather(
+        asyncio.to_thread(_write_bytes, tmp, data, do_fsync),
+        asyncio.to_thread(_rotate_backups),
+        return_exceptions=True,
+    )
+    if isinstance(write_res, BaseException):
+        raise write_res
+
+    bak1 = f"{path}.bak1"
+    if os.path.exists(path):
+        _link_backup(path, bak1)
 
     try:
         os.replace(tmp, path)
     except Exception as e:
-        try:
-            if os.path.exists(bak1):
-                os.replace(bak1, path)
-        except Exception:
-            pass
+        # main was only linked, never moved -> nothing to roll back
         try:
             if os.path.exists(tmp):
                 os.unlink(tmp)
@@ -671,19 +1171,52 @@ async def _atomic_write(path: str, data: bytes) -> None:
             pass
         raise e
 
+    if not do_fsync:
+        _saves_since_fsync += 1
+        return
+
     try:
         d = os.path.dirname(path) or "."
         _fsync_best_effort(d)
     except Exception:
         pass
 
+    _last_fsync_ts = time.time()
+    _saves_since_fsync = 0
+
+
+def _build_envelope(
+    snapshot: Union[bytes, Dict[str, Any]], core_version: Any, schema_version: Any
+) -> Tuple[bytes, str]:
+    """
+    CPU-bound half of save_brain (decode + canonicalize + SoA + msgpack + lz4 + sha). Runs in
+    a worker thread: snapshot must be detached (from _state_snapshot), never live state.
+    """
+    if isinstance(snapshot, bytes):
+        payload_state = _snapshot_to_payload(snapshot, schema_version)
+    else:
+        payload_state = snapshot
+    data = {
+        "v": PERSISTENCE_VERSION,
+        "timestamp": float(time.time()),
+        "meta": {
+            "core_version_seen": str(core_version) if core_version is not None else None,
+            "schema_version": _safe_int(schema_version, 1),
+        },
+        "state": _payload_to_disk(payload_state),
+    }
+    return _pack_envelope(data)
+
 
 # -----------------------
 # Public API
 # -----------------------
-async def save_brain(state: PsycheState, force: bool = False):
-    """SAVE — IMMORTALITY LAYER"""
-    global _memory_fallback_payload, _disk_failed
+async def save_brain(state: PsycheState, force: bool = False, durable: bool = False):
+    """
+    SAVE — IMMORTALITY LAYER
+    durable=True forces the fsync barrier (shutdown / emergency); routine saves coalesce it.
+    """
+    global _memory_fallback_payload, _disk_failed, _last_content_sha
 
     async with _IO_LOCK:
         if _disk_failed and not force:
@@ -695,26 +1228,33 @@ async def save_brain(state: PsycheState, force: bool = False):
             return
 
         try:
-            payload_state = _state_to_payload(state)
-            payload_state = _canonicalize_payload_state(payload_state)
-            payload_state = _to_primitive_safe(payload_state)
-
-            data = {
-                "v": PERSISTENCE_VERSION,
-                "timestamp": float(time.time()),
-                "meta": {
-                    "core_version_seen": getattr(state, "version", None),
-                    "schema_version": int(getattr(state, "schema_version", 1)),
-                },
-                "state": payload_state,
-            }
-
-            data = _to_primitive_safe(data)  # type: ignore[assignment]
-
-            payload_bytes = msgpack.packb(data, use_bin_type=True)
-            envelope = _pack_envelope(payload_bytes)
+            # Snapshot on the loop: serialize_to_bytes encodes the live state in one pass,
+            # so the worker thread never touches live state while trading loops mutate it.
+            snapshot = _state_snapshot(state)
+
+            # Decode/canonicalize/encode/compress/hash off the loop (lz4 + hashlib release the GIL).
+            # _IO_LOCK stays held so saves land on disk in snapshot order.
+            envelope, content_sha = await asyncio.to_thread(
+                _build_envelope,
+                snapshot,
+                getattr(state, "version", None),
+                getattr(state, "schema_version", 1),
+            )
 
-            await _atomic_write(BRAIN_PATH, envelope)
+            # Nothing changed since the last write -> skip tmp write, rotation and fsync.
+            # force/durable callers always hit disk.
+            if (
+                not force
+                and not durable
+                and content_sha == _last_content_sha
+                and os.path.exists(BRAIN_PATH)
+            ):
+                log_brain.debug("BRAIN UNCHANGED — write elided")
+                return
+
+            _last_content_sha = None
+            await _atomic_write(BRAIN_PATH, envelope, force_fsync=durable)
+            _last_content_sha = content_sha
 
             _disk_failed = False
             _memory_fallback_payload = None
@@ -733,7 +1273,7 @@ async def save_brain(state: PsycheState, force: bool = False):
 
 async def load_brain(state: PsycheState) -> bool:
     """LOAD — RESURRECTION"""
-    global _memory_fallback_payload, _disk_failed
+    global _memory_fallback_payload, _disk_failed, _last_content_sha
 
     async with _IO_LOCK:
         runtime_version = getattr(state, "version", None)
@@ -757,8 +1297,7 @@ async def load_brain(state: PsycheState) -> bool:
                 continue
 
             try:
-                async with aiofiles.open(path, "rb") as f:
-                    raw = await f.read()
+                raw = await asyncio.to_thread(_read_bytes, path)
 
                 env = _unpack_envelope(raw)
                 if env is None:
@@ -766,16 +1305,12 @@ async def load_brain(state: PsycheState) -> bool:
                     continue
 
                 blob = env["blob"]
-                payload_bytes = lz4.frame.decompress(blob)
+                payload_bytes, payload_sha = _decompress_with_sha(blob)
 
-                if env.get("payload_sha"):
-                    try:
-                        if _sha256_hex(payload_bytes) != env["payload_sha"]:
-                            log_brain.warning(f"Payload SHA mismatch in {path} (continuing anyway)")
-                    except Exception:
-                        pass
+                if env.get("payload_sha") and payload_sha != env["payload_sha"]:
+                    log_brain.warning(f"Payload SHA mismatch in {path} (continuing anyway)")
 
-                data = msgpack.unpackb(payload_bytes, raw=False)
+                data = _DEC.decode(payload_bytes)
                 if not isinstance(data, dict):
                     log_brain.warning(f"Invalid payload root in {path} — skipping")
                     continue
@@ -800,10 +1335,13 @@ async def load_brain(state: PsycheState) -> bool:
                     f"BRAIN RESURRECTED FROM {path} — {len(getattr(state, 'positions', {}) or {})} positions"
                 )
 
-                # Heal forward: if loaded from backup, re-save main
+                # Heal forward: if loaded from backup, put its (already verified) bytes back as main.
+                # No save_brain here: _IO_LOCK is held and asyncio.Lock is not re-entrant.
                 try:
                     if i != 0:
-                        await save_brain(state, force=True)
+                        _last_content_sha = None
+                        await _atomic_write(BRAIN_PATH, raw, force_fsync=True)
+                        log_brain.critical(f"BRAIN HEALED — main restored from {path}")
                 except Exception:
                     pass
 
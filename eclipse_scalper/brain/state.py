@@ -7,14 +7,47 @@
 # - Fix: blacklist_reason merge uses "prefer new" (strings), not dict-merge
 # - Adds last_trail_ts default in symbol_performance (exit.py expects it)
 # - Caps: known_exit_order_ids, entry_confidence_history, trailing_order_ids, entry_watches
+# - _symkey: memoized, one replace + one translate, result interned (pointer-equal dict keys)
+# - entry_watches cap: heapq.nlargest over pre-extracted created_ts (no full sort)
+# - Single canonicalization pass: migration leaves map keys to validate(); tail hygiene loops
+#   rely on the canonical keys instead of re-running _symkey; canonical maps take a fast path
+# - Batch float hygiene (confidence histories, funding snapshot) vectorized via NumPy for long inputs
+# - Position is slotted (no per-instance __dict__); runtime-only stop_order_id declared
+# - Position.validate() returns early when the position is already at its canonical fixpoint
+# - known_exit_order_ids: BoundedOrderedSet (set subclass, insertion-ordered, O(1) oldest-evict)
+# - to_dict: explicit field build (one-level container copies) instead of asdict deep-copy
+# - current_day from epoch: ordinal day math instead of utcfromtimestamp().date()
+# - cleanup_expired_blacklist: expired keys via one comprehension + dict.pop (no per-symbol try/except)
+# - Canonical keys are identity-checked against the interned _symkey form: every symbol-keyed
+#   map (and Position.symbol) shares one string object per symbol
+# - symbol_performance defaults: one keys() superset check, missing keys filled from a frozen table
+# - _safe_float/_safe_int: exact float/int/None fast paths ahead of the try/float() fallback
+# - validate(): one canonical-key memo shared by all symbol maps (each symbol checked once per pass)
+# - Cap trims: deque(maxlen)/islice tails and in-place del instead of full-length temp lists
+# - recompute_derived: skipped when its inputs/outputs are unchanged since the last run
+# - validate()/_merge_positions_canon: one _now() per pass, passed down to rebuilt Positions
+# - _symkey: bounded dict memo probed inline (replaces the lru_cache hit path)
+# - _canon_map_keys rebuild: merge_fn branch hoisted out of the key loop (one probe per key)
+# - validate(): positions loop iterates the live map, failed entries removed afterwards
+# - entry_watches: watch dicts repaired in place (no per-watch copy; pollers keep their reference)
+# - serialize_to_bytes: msgpack snapshot encoded straight from the live containers (no to_dict copy)
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, Set, Optional, List, Tuple, Any, Callable
-from datetime import date, datetime
+from collections import deque
+from dataclasses import dataclass, field, fields
+from typing import Dict, Set, Optional, List, Tuple, Any, Callable, ClassVar
+from datetime import date
+from types import MappingProxyType
+import heapq
+from itertools import islice
+import math
+import sys
 import time
 
+import msgspec
+import numpy as np
+
 DEFAULT_CORE_VERSION = "god-emperor-ascendant-absolute-v4.6-2026-jan06"
 STATE_SCHEMA_VERSION = 3
 
@@ -29,6 +62,17 @@ def _now() -> float:
 
 
 def _safe_float(x, default: float = 0.0) -> float:
+    # Fast paths: validated fields are exact floats/ints; None is the usual "missing"
+    t = type(x)
+    if t is float:
+        return x if x == x else default  # NaN
+    if t is int:
+        try:
+            return float(x)
+        except OverflowError:
+            return default
+    if x is None:
+        return default
     try:
         v = float(x)
         if v != v:  # NaN
@@ -38,7 +82,51 @@ def _safe_float(x, default: float = 0.0) -> float:
         return default
 
 
+# Below this length the per-call NumPy overhead beats the per-element loop it replaces
+_NP_BATCH_MIN = 32
+
+
+def _safe_float_list(values: List[Any]) -> List[float]:
+    """
+    Batch _safe_float(x, 0.0). Long inputs go through one float64 array (NaN -> 0.0);
+    anything NumPy can't coerce element-wise (junk strings, nested values) falls back
+    to the scalar path so results stay identical.
+    """
+    if len(values) >= _NP_BATCH_MIN:
+        try:
+            a = np.array(values, dtype=np.float64)
+            if a.ndim == 1:
+                a[np.isnan(a)] = 0.0
+                return a.tolist()
+        except Exception:
+            pass
+    return [_safe_float(x, 0.0) for x in values]
+
+
+_EPOCH_ORDINAL = 719163  # date(1970, 1, 1).toordinal()
+
+
+# symbol_performance defaults (exit.py expects every key). The tuple is never stored:
+# the hygiene loop turns trailing_order_ids into a fresh list.
+_PERF_DEFAULTS = MappingProxyType({
+    "pnl": 0.0,
+    "wins": 0,
+    "losses": 0,
+    "last_win": 0.0,
+    "pos_realized_pnl": 0.0,
+    "entry_size_abs": 0.0,
+    "mfe_pct": 0.0,
+    "trailing_order_ids": (),
+    "last_trail_ts": 0.0,
+})
+_PERF_DEFAULT_KEYS = frozenset(_PERF_DEFAULTS)
+
+
 def _safe_int(x, default: int = 0) -> int:
+    if type(x) is int:
+        return x if x >= 0 else default
+    if x is None:
+        return default
     try:
         v = int(x)
         return v if v >= 0 else default
@@ -55,22 +143,49 @@ def _symkey(sym: Any) -> str:
       'btcusdt'       -> 'BTCUSDT'
       None            -> ''
     """
+    if type(sym) is str:
+        ck = _symkey_memo_get(sym)
+        return ck if ck is not None else _symkey_str(sym)
     if sym is None:
         return ""
     try:
-        s = str(sym).strip().upper()
+        raw = str(sym)
     except Exception:
         return ""
-    if not s:
-        return ""
+    return _symkey_str(raw)
+
+
+# '/USDT' -> 'USDT' and ':USDT' -> 'USDT' are just separator drops, so the only
+# real substitution is the settle suffix; every remaining ':' / '/' is removed.
+_SETTLE_SUFFIX = "/USDT:USDT"
+_DROP_SEPARATORS = str.maketrans("", "", ":/")
 
-    s = s.replace("/USDT:USDT", "USDT").replace("/USDT", "USDT")
-    s = s.replace(":USDT", "USDT").replace(":", "")
-    s = s.replace("/", "")
 
-    if s.endswith("USDTUSDT"):
-        s = s[:-4]
-    return s
+# raw str -> interned canonical key. A bare dict probe beats an lru_cache hit (no recency
+# bookkeeping, and hot callers inline the .get); the symbol alphabet is bounded, so on
+# overflow the memo simply starts over.
+_SYMKEY_MEMO: Dict[str, str] = {}
+_SYMKEY_MEMO_MAX = 4096
+_symkey_memo_get = _SYMKEY_MEMO.get
+
+
+def _symkey_str(raw: str) -> str:
+    ck = _symkey_memo_get(raw)
+    if ck is not None:
+        return ck
+
+    s = raw.strip().upper()
+    if s:
+        s = s.replace(_SETTLE_SUFFIX, "USDT").translate(_DROP_SEPARATORS)
+        if s.endswith("USDTUSDT"):
+            s = s[:-4]
+    # Interned: every map keyed by this symbol shares one string object
+    ck = sys.intern(s) if s else ""
+
+    if len(_SYMKEY_MEMO) >= _SYMKEY_MEMO_MAX:
+        _SYMKEY_MEMO.clear()
+    _SYMKEY_MEMO[raw] = ck
+    return ck
 
 
 def _merge_max(a: Any, b: Any) -> Any:
@@ -97,37 +212,224 @@ def _merge_pick_b(a: Any, b: Any) -> Any:
     return b if b is not None else a
 
 
-def _canon_map_keys(m: Any, *, merge_fn: Optional[Callable[[Any, Any], Any]] = None) -> Dict[str, Any]:
+_MISSING = object()
+
+
+def _keys_canonical(m: Dict[Any, Any], seen: Dict[str, str]) -> bool:
+    """
+    True when every key of m already is its interned canonical form. seen holds keys
+    proven canonical earlier in the same pass (the symbol maps share most keys), so each
+    distinct symbol goes through _symkey_str once instead of once per map.
+    """
+    get = seen.get
+    for k in m:
+        if type(k) is not str or not k:
+            return False
+        if get(k) is k:
+            continue
+        if (_symkey_memo_get(k) or _symkey_str(k)) is not k:
+            return False
+        seen[k] = k
+    return True
+
+
+def _canon_map_keys(
+    m: Any,
+    *,
+    merge_fn: Optional[Callable[[Any, Any], Any]] = None,
+    seen: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
     """
     Canonicalize dict keys; drop empty keys; never throws.
     If merge_fn is provided, collisions are merged instead of overwritten.
+    seen: canonical-key memo shared across the maps of one validate() pass.
     """
     out: Dict[str, Any] = {}
     if not isinstance(m, dict):
         return out
 
+    # Steady state: every key already is its interned canonical form -> no collisions,
+    # nothing to merge. Equal-but-not-interned keys (fresh from a decoder or a caller's own
+    # symkey helper) take the rebuild below once, so all maps end up sharing one key object.
+    if _keys_canonical(m, {} if seen is None else seen):
+        return dict(m)
+
+    # Rebuild: merge_fn is fixed per call, so branch once instead of per key
+    if merge_fn is None:
+        for k, v in m.items():
+            ck = _symkey(k)
+            if ck:
+                out[ck] = v
+        return out
+
+    get = out.get
     for k, v in m.items():
         ck = _symkey(k)
         if not ck:
             continue
 
-        if ck in out and merge_fn is not None:
-            try:
-                out[ck] = merge_fn(out[ck], v)
-            except Exception:
-                out[ck] = v
-        else:
+        prev = get(ck, _MISSING)
+        if prev is _MISSING:
             out[ck] = v
+            continue
+        try:
+            out[ck] = merge_fn(prev, v)
+        except Exception:
+            out[ck] = v
+
+    return out
+
+
+class BoundedOrderedSet(set):
+    """
+    set that remembers insertion order and evicts the oldest member past maxlen.
+    Subclasses set so `isinstance(x, set)` guards (guardian/exit) and `in` stay native.
+    str members are interned on add. In-place set operators resync the order deque.
+    """
+
+    __slots__ = ("_order", "maxlen")
+
+    def __init__(self, iterable: Any = (), maxlen: int = KNOWN_EXIT_IDS_CAP):
+        super().__init__()
+        self.maxlen = maxlen
+        self._order: deque = deque()
+        for x in iterable:
+            self.add(x)
+
+    def add(self, x: Any) -> None:
+        if type(x) is str:
+            x = sys.intern(x)
+        if set.__contains__(self, x):
+            return
+        set.add(self, x)
+        self._order.append(x)
+        if len(self._order) > self.maxlen:
+            set.discard(self, self._order.popleft())
+
+    def discard(self, x: Any) -> None:
+        if set.__contains__(self, x):
+            set.discard(self, x)
+            self._order.remove(x)
+
+    def remove(self, x: Any) -> None:
+        if not set.__contains__(self, x):
+            raise KeyError(x)
+        self.discard(x)
+
+    def pop(self) -> Any:
+        if not self._order:
+            raise KeyError("pop from an empty set")
+        x = self._order.popleft()
+        set.discard(self, x)
+        return x
+
+    def clear(self) -> None:
+        set.clear(self)
+        self._order.clear()
+
+    def update(self, *iterables: Any) -> None:
+        for it in iterables:
+            for x in it:
+                self.add(x)
+
+    def __ior__(self, other: Any) -> "BoundedOrderedSet":
+        self.update(other)
+        return self
+
+    def _resync(self) -> None:
+        self._order = deque(x for x in self._order if set.__contains__(self, x))
+
+    def difference_update(self, *others: Any) -> None:
+        set.difference_update(self, *others)
+        self._resync()
+
+    def intersection_update(self, *others: Any) -> None:
+        set.intersection_update(self, *others)
+        self._resync()
+
+    def __isub__(self, other: Any) -> "BoundedOrderedSet":
+        self.difference_update(other)
+        return self
+
+    def __iand__(self, other: Any) -> "BoundedOrderedSet":
+        self.intersection_update(other)
+        return self
+
+    def symmetric_difference_update(self, other: Any) -> None:
+        for x in list(other):
+            if set.__contains__(self, x):
+                self.discard(x)
+            else:
+                self.add(x)
+
+    def __ixor__(self, other: Any) -> "BoundedOrderedSet":
+        self.symmetric_difference_update(other)
+        return self
+
+    def __iter__(self):
+        return iter(self._order)
+
+    def copy(self) -> "BoundedOrderedSet":
+        return type(self)(self._order, self.maxlen)
+
+    def __reduce__(self):
+        return (type(self), (list(self._order), self.maxlen))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._order)!r}, maxlen={self.maxlen})"
+
+
+def _encode_extras(obj: Any) -> Any:
+    """enc_hook for serialize_to_bytes: values msgpack has no native form for."""
+    to_msgpack = getattr(type(obj), "__msgpack__", None)
+    if to_msgpack is not None:
+        return to_msgpack(obj)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"serialize_to_bytes: unsupported type {type(obj).__name__}")
 
+
+# date/datetime/set/tuple/dataclass are native to msgspec; the hook only sees the rest.
+_SNAPSHOT_ENC = msgspec.msgpack.Encoder(enc_hook=_encode_extras)
+
+
+def _streak_rows_to_disk(sh: Any) -> List[Tuple[str, int, float]]:
+    """streak_history: (date, int, float) -> (iso, int, float); malformed rows dropped."""
+    if not isinstance(sh, list):
+        return []
+    cleaned = []
+    for row in sh:
+        try:
+            d, n, v = row
+            d_iso = d.isoformat() if isinstance(d, date) else str(d)
+            cleaned.append((d_iso, _safe_int(n, 0), _safe_float(v, 0.0)))
+        except Exception:
+            continue
+    return cleaned
+
+
+def _copy_map_1(m: Any) -> Dict[Any, Any]:
+    """Copy a map one level deep: inner dict/list values get their own container."""
+    if not isinstance(m, dict):
+        return {}
+    out: Dict[Any, Any] = {}
+    for k, v in m.items():
+        t = type(v)
+        if t is dict:
+            v = dict(v)
+        elif t is list:
+            v = list(v)
+        out[k] = v
     return out
 
 
 def _merge_entry_watches_canon(m: Any) -> Dict[str, Dict[str, Any]]:
     """
     Canonicalize entry_watches keys and keep the newest created_ts per symbol.
-    Schema is defined by execution/entry_watch.py.
+    Schema is defined by execution/entry_watch.py. Watch dicts are repaired in place.
     """
     out: Dict[str, Dict[str, Any]] = {}
+    cts: Dict[str, float] = {}  # created_ts per kept watch (parsed once)
     if not isinstance(m, dict):
         return out
 
@@ -136,42 +438,48 @@ def _merge_entry_watches_canon(m: Any) -> Dict[str, Dict[str, Any]]:
         if not k or not isinstance(w, dict):
             continue
 
-        w2 = dict(w)
-        w2["k"] = k
+        # No copy: poll_entry_watches holds the watch dict across awaits and keeps writing
+        # busy/done/filled_qty into it; a copy here (validate runs on every save) would
+        # orphan those writes. Only touch keys that actually need repair.
+        if w.get("k") is not k:
+            w["k"] = k
 
-        try:
-            w2["symbol_any"] = str(w2.get("symbol_any") or k)
-        except Exception:
-            w2["symbol_any"] = k
+        sa = w.get("symbol_any")
+        if type(sa) is not str or not sa:
+            try:
+                w["symbol_any"] = str(sa or k)
+            except Exception:
+                w["symbol_any"] = k
 
-        ct = _safe_float(w2.get("created_ts", 0.0), 0.0)
+        ct = _safe_float(w.get("created_ts", 0.0), 0.0)
 
-        if k not in out:
-            out[k] = w2
-        else:
-            prev_ct = _safe_float(out[k].get("created_ts", 0.0), 0.0)
-            if ct >= prev_ct:
-                out[k] = w2
+        if k not in out or ct >= cts[k]:
+            out[k] = w
+            cts[k] = ct
 
-    # cap deterministically (keep newest)
+    # cap deterministically (keep newest); (ts, position) tuples -> same survivors and
+    # order as a stable ascending sort tail, without sorting everything
     try:
         if len(out) > ENTRY_WATCHES_CAP:
-            items = sorted(out.items(), key=lambda kv: _safe_float(kv[1].get("created_ts", 0.0), 0.0))
-            out = dict(items[-ENTRY_WATCHES_CAP:])
+            top = heapq.nlargest(ENTRY_WATCHES_CAP, ((cts[k], i, k) for i, k in enumerate(out)))
+            out = {k: out[k] for _, _, k in reversed(top)}
     except Exception:
         pass
 
     return out
 
 
-def _merge_positions_canon(pos_map: Any) -> Dict[str, "Position"]:
+def _merge_positions_canon(pos_map: Any, now_ts: Optional[float] = None) -> Dict[str, "Position"]:
     """
     Canonicalize position keys and repair values into Position.
     Collision policy: keep newer entry_ts.
+    now_ts: one clock read shared by every rebuilt Position (missing/bad entry_ts).
     """
     out: Dict[str, Position] = {}
     if not isinstance(pos_map, dict):
         return out
+    if now_ts is None:
+        now_ts = _now()
 
     for sym, pv in pos_map.items():
         k = _symkey(sym)
@@ -183,7 +491,7 @@ def _merge_positions_canon(pos_map: Any) -> Dict[str, "Position"]:
             p = pv
         elif isinstance(pv, dict):
             try:
-                p = Position(**pv)
+                p = Position(**pv) if "entry_ts" in pv else Position(entry_ts=now_ts, **pv)
             except Exception:
                 p = Position(
                     side=str(pv.get("side", "long")),
@@ -191,7 +499,7 @@ def _merge_positions_canon(pos_map: Any) -> Dict[str, "Position"]:
                     entry_price=_safe_float(pv.get("entry_price", 0.0), 0.0),
                     atr=_safe_float(pv.get("atr", 0.0), 0.0),
                     leverage=_safe_int(pv.get("leverage", 0), 0),
-                    entry_ts=_safe_float(pv.get("entry_ts", _now()), _now()),
+                    entry_ts=_safe_float(pv.get("entry_ts", now_ts), now_ts),
                     hard_stop_order_id=pv.get("hard_stop_order_id"),
                     trailing_active=bool(pv.get("trailing_active", False)),
                     breakeven_moved=bool(pv.get("breakeven_moved", False)),
@@ -202,7 +510,7 @@ def _merge_positions_canon(pos_map: Any) -> Dict[str, "Position"]:
         else:
             continue
 
-        p.validate()
+        p.validate(now_ts)
         p.symbol = k
 
         if k not in out:
@@ -217,7 +525,7 @@ def _merge_positions_canon(pos_map: Any) -> Dict[str, "Position"]:
     return out
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     side: str  # 'long' or 'short'
     size: float
@@ -235,7 +543,38 @@ class Position:
 
     symbol: Optional[str] = None  # canonical
 
-    def validate(self) -> None:
+    # Runtime-only: last reduce-only stop seen/placed by reconcile (not persisted)
+    stop_order_id: Optional[str] = field(default=None, compare=False, repr=False)
+
+    def _is_canonical(self) -> bool:
+        """
+        True when validate() would change nothing. A pure check (no dirty bit): callers
+        assign fields directly (reconcile/entry), so a cached flag could go stale.
+        """
+        for x in (self.entry_price, self.atr, self.entry_ts, self.confidence, self.last_breakeven_move):
+            if type(x) is not float or x != x:
+                return False
+        size = self.size
+        if type(size) is not float or size != size or math.copysign(1.0, size) != 1.0:
+            return False
+        if type(self.side) is not str or self.side not in ("long", "short"):
+            return False
+        if type(self.leverage) is not int or self.leverage < 0:
+            return False
+        if type(self.trailing_active) is not bool or type(self.breakeven_moved) is not bool:
+            return False
+        hs = self.hard_stop_order_id
+        if hs is not None and type(hs) is not str:
+            return False
+        sym = self.symbol
+        if sym is not None and (type(sym) is not str or not sym or _symkey_str(sym) is not sym):
+            return False
+        return True
+
+    def validate(self, now_ts: Optional[float] = None) -> None:
+        if self._is_canonical():
+            return
+
         self.side = (self.side or "").lower().strip()
         if self.side not in ("long", "short"):
             self.side = "long"
@@ -246,7 +585,8 @@ class Position:
         self.entry_price = _safe_float(self.entry_price, 0.0)
         self.atr = _safe_float(self.atr, 0.0)
         self.leverage = _safe_int(self.leverage, 0)
-        self.entry_ts = _safe_float(self.entry_ts, _now())
+        ets = _safe_float(self.entry_ts, math.nan)
+        self.entry_ts = ets if ets == ets else (_now() if now_ts is None else now_ts)
         self.confidence = _safe_float(self.confidence, 0.0)
         self.last_breakeven_move = _safe_float(self.last_breakeven_move, 0.0)
 
@@ -259,6 +599,23 @@ class Position:
         if self.symbol is not None:
             self.symbol = _symkey(self.symbol) or None
 
+    def __msgpack__(self) -> Dict[str, Any]:
+        """Primitive dict for persistence (dispatched by type, no vars() walk)."""
+        return {
+            "side": self.side,
+            "size": self.size,
+            "entry_price": self.entry_price,
+            "atr": self.atr,
+            "leverage": self.leverage,
+            "entry_ts": self.entry_ts,
+            "hard_stop_order_id": self.hard_stop_order_id,
+            "trailing_active": self.trailing_active,
+            "breakeven_moved": self.breakeven_moved,
+            "confidence": self.confidence,
+            "last_breakeven_move": self.last_breakeven_move,
+            "symbol": self.symbol,
+        }
+
 
 @dataclass
 class PsycheState:
@@ -285,7 +642,7 @@ class PsycheState:
     blacklist_reason: Dict[str, str] = field(default_factory=dict)
     consecutive_losses: Dict[str, int] = field(default_factory=dict)
     last_exit_time: Dict[str, float] = field(default_factory=dict)
-    known_exit_order_ids: Set[str] = field(default_factory=set)
+    known_exit_order_ids: Set[str] = field(default_factory=BoundedOrderedSet)
 
     symbol_performance: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     entry_confidence_history: Dict[str, List[float]] = field(default_factory=dict)
@@ -305,6 +662,10 @@ class PsycheState:
     win_rate: float = 0.0
     max_drawdown: float = 0.0
 
+    # recompute_derived memo: the input/output values it last saw (not a dataclass field,
+    # so never persisted; instances shadow this class default on first recompute)
+    _derived_key: ClassVar[Optional[Tuple[Any, ...]]] = None
+
     # ---------------------------
     # Migration / construction
     # ---------------------------
@@ -343,23 +704,12 @@ class PsycheState:
 
             kei = getattr(self, "known_exit_order_ids", None)
             if isinstance(kei, (list, tuple)):
-                self.known_exit_order_ids = set(str(x) for x in kei)
+                self.known_exit_order_ids = BoundedOrderedSet(str(x) for x in kei)
             elif not isinstance(kei, set):
-                self.known_exit_order_ids = set()
+                self.known_exit_order_ids = BoundedOrderedSet()
 
-            self.positions = _merge_positions_canon(getattr(self, "positions", {}))
-
-            self.blacklist = _canon_map_keys(getattr(self, "blacklist", {}), merge_fn=_merge_max)
-            self.last_exit_time = _canon_map_keys(getattr(self, "last_exit_time", {}), merge_fn=_merge_max)
-            self.consecutive_losses = _canon_map_keys(getattr(self, "consecutive_losses", {}), merge_fn=_merge_max)
-
-            self.blacklist_reason = _canon_map_keys(getattr(self, "blacklist_reason", {}), merge_fn=_merge_pick_b)
-
-            self.symbol_performance = _canon_map_keys(getattr(self, "symbol_performance", {}), merge_fn=_merge_dict_shallow)
-            self.entry_confidence_history = _canon_map_keys(getattr(self, "entry_confidence_history", {}), merge_fn=_merge_dict_shallow)
-            self.funding_rate_snapshot = _canon_map_keys(getattr(self, "funding_rate_snapshot", {}), merge_fn=_merge_dict_shallow)
-
-            self.entry_watches = _merge_entry_watches_canon(getattr(self, "entry_watches", {}))
+            # Map keys: from_loaded() runs validate() right after, which canonicalizes
+            # every map with the same merge policies — no second pass here.
 
             self.schema_version = STATE_SCHEMA_VERSION
 
@@ -370,32 +720,37 @@ class PsycheState:
         if self.run_context is None or not isinstance(self.run_context, dict):
             self.run_context = {}
 
-        self.positions = _merge_positions_canon(self.positions)
+        now_ts = _now()  # single clock read for every timestamp default below
 
-        self.blacklist = _canon_map_keys(self.blacklist, merge_fn=_merge_max)
-        self.last_exit_time = _canon_map_keys(self.last_exit_time, merge_fn=_merge_max)
-        self.consecutive_losses = _canon_map_keys(self.consecutive_losses, merge_fn=_merge_max)
+        self.positions = _merge_positions_canon(self.positions, now_ts)
 
-        self.blacklist_reason = _canon_map_keys(self.blacklist_reason, merge_fn=_merge_pick_b)
-        self.symbol_performance = _canon_map_keys(self.symbol_performance, merge_fn=_merge_dict_shallow)
-        self.entry_confidence_history = _canon_map_keys(self.entry_confidence_history, merge_fn=_merge_dict_shallow)
-        self.funding_rate_snapshot = _canon_map_keys(self.funding_rate_snapshot, merge_fn=_merge_dict_shallow)
+        # One canonical-key memo for all symbol maps: a symbol is checked once, not per map
+        # (positions keys come straight from _symkey, so they seed it)
+        seen: Dict[str, str] = {k: k for k in self.positions}
 
-        self.entry_watches = _merge_entry_watches_canon(getattr(self, "entry_watches", {}))
+        self.blacklist = _canon_map_keys(self.blacklist, merge_fn=_merge_max, seen=seen)
+        self.last_exit_time = _canon_map_keys(self.last_exit_time, merge_fn=_merge_max, seen=seen)
+        self.consecutive_losses = _canon_map_keys(self.consecutive_losses, merge_fn=_merge_max, seen=seen)
 
-        # known_exit_order_ids: ensure set[str]
-        if self.known_exit_order_ids is None:
-            self.known_exit_order_ids = set()
-        elif isinstance(self.known_exit_order_ids, (list, tuple)):
-            self.known_exit_order_ids = set(str(x) for x in self.known_exit_order_ids)
-        elif not isinstance(self.known_exit_order_ids, set):
-            self.known_exit_order_ids = set()
+        self.blacklist_reason = _canon_map_keys(self.blacklist_reason, merge_fn=_merge_pick_b, seen=seen)
+        self.symbol_performance = _canon_map_keys(self.symbol_performance, merge_fn=_merge_dict_shallow, seen=seen)
+        self.entry_confidence_history = _canon_map_keys(
+            self.entry_confidence_history, merge_fn=_merge_dict_shallow, seen=seen
+        )
+        self.funding_rate_snapshot = _canon_map_keys(self.funding_rate_snapshot, merge_fn=_merge_dict_shallow, seen=seen)
 
-        try:
-            if len(self.known_exit_order_ids) > KNOWN_EXIT_IDS_CAP:
-                self.known_exit_order_ids = set(list(self.known_exit_order_ids)[-KNOWN_EXIT_IDS_CAP:])
-        except Exception:
-            pass
+        self.entry_watches = _merge_entry_watches_canon(getattr(self, "entry_watches", {}))
+
+        # known_exit_order_ids: ensure BoundedOrderedSet (the cap is enforced on add)
+        kei = self.known_exit_order_ids
+        if type(kei) is not BoundedOrderedSet:
+            if isinstance(kei, (list, tuple)):
+                self.known_exit_order_ids = BoundedOrderedSet(str(x) for x in kei)
+            elif isinstance(kei, set):
+                # plain set (e.g. reset by guardian/exit): no order to keep
+                self.known_exit_order_ids = BoundedOrderedSet(kei)
+            else:
+                self.known_exit_order_ids = BoundedOrderedSet()
 
         self.current_equity = max(0.0, _safe_float(self.current_equity, 0.0))
         self.peak_equity = max(0.0, _safe_float(self.peak_equity, 0.0))
@@ -406,13 +761,13 @@ class PsycheState:
         self.total_wins = max(0, _safe_int(self.total_wins, 0))
         self.win_streak = max(0, _safe_int(self.win_streak, 0))
 
-        self.peak_equity_timestamp = _safe_float(self.peak_equity_timestamp, _now())
+        self.peak_equity_timestamp = _safe_float(self.peak_equity_timestamp, now_ts)
         self.current_drawdown_pct = max(0.0, _safe_float(self.current_drawdown_pct, 0.0))
         self.max_drawdown = max(0.0, _safe_float(self.max_drawdown, 0.0))
         self.win_rate = max(0.0, _safe_float(self.win_rate, 0.0))
 
         self.funding_paid = _safe_float(self.funding_paid, 0.0)
-        self.session_start_timestamp = _safe_float(self.session_start_timestamp, _now())
+        self.session_start_timestamp = _safe_float(self.session_start_timestamp, now_ts)
         self.uptime_seconds = max(0.0, _safe_float(self.uptime_seconds, 0.0))
         self.adaptive_risk_multiplier = max(0.0, _safe_float(self.adaptive_risk_multiplier, 1.0))
 
@@ -422,7 +777,8 @@ class PsycheState:
                 if isinstance(self.current_day, str):
                     self.current_day = date.fromisoformat(self.current_day)
                 elif isinstance(self.current_day, (int, float)):
-                    self.current_day = datetime.utcfromtimestamp(float(self.current_day)).date()
+                    # UTC day = epoch ordinal + whole days (floor: pre-1970 stays correct)
+                    self.current_day = date.fromordinal(_EPOCH_ORDINAL + int(float(self.current_day) // 86400))
                 else:
                     self.current_day = None
             except Exception:
@@ -430,102 +786,84 @@ class PsycheState:
 
         if self.current_equity > 0 and self.peak_equity < self.current_equity:
             self.peak_equity = self.current_equity
-            self.peak_equity_timestamp = _now()
+            self.peak_equity_timestamp = now_ts
 
         if self.total_wins > self.total_trades:
             self.total_wins = self.total_trades
 
-        # validate positions
-        for k, p in list(self.positions.items()):
+        # validate positions (iterate the live dict; failures are dropped after the loop)
+        dropped: Optional[List[str]] = None
+        for k, p in self.positions.items():
             try:
-                p.validate()
+                p.validate(now_ts)
                 p.symbol = k
             except Exception:
-                try:
-                    del self.positions[k]
-                except Exception:
-                    pass
+                if dropped is None:
+                    dropped = []
+                dropped.append(k)
+        if dropped:
+            for k in dropped:
+                self.positions.pop(k, None)
 
-        # symbol_performance hygiene
-        for sym, perf in list(self.symbol_performance.items()):
-            k = _symkey(sym)
-            if not k:
-                try:
-                    del self.symbol_performance[sym]
-                except Exception:
-                    pass
-                continue
+        # Tail hygiene: keys of these maps were canonicalized above, so only values are
+        # repaired (in place, same keys -> safe to iterate the live dict).
 
+        # symbol_performance hygiene
+        for k, perf in self.symbol_performance.items():
             if not isinstance(perf, dict):
-                self.symbol_performance[k] = {"pnl": 0.0, "wins": 0, "losses": 0, "last_win": 0.0}
-                perf = self.symbol_performance[k]
-            else:
-                if k != sym:
-                    self.symbol_performance[k] = perf
-                    try:
-                        del self.symbol_performance[sym]
-                    except Exception:
-                        pass
-                    perf = self.symbol_performance[k]
-
-            perf.setdefault("pnl", 0.0)
-            perf.setdefault("wins", 0)
-            perf.setdefault("losses", 0)
-            perf.setdefault("last_win", 0.0)
-            perf.setdefault("pos_realized_pnl", 0.0)
-            perf.setdefault("entry_size_abs", 0.0)
-            perf.setdefault("mfe_pct", 0.0)
-            perf.setdefault("trailing_order_ids", [])
-            perf.setdefault("last_trail_ts", 0.0)
-
-            if not isinstance(perf.get("trailing_order_ids"), list):
-                perf["trailing_order_ids"] = list(perf.get("trailing_order_ids") or [])
-            if len(perf["trailing_order_ids"]) > TRAILING_IDS_CAP:
-                perf["trailing_order_ids"] = perf["trailing_order_ids"][-TRAILING_IDS_CAP:]
+                perf = {"pnl": 0.0, "wins": 0, "losses": 0, "last_win": 0.0}
+                self.symbol_performance[k] = perf
+
+            # One C-level subset check; defaults are filled in place (callers may hold perf)
+            if not perf.keys() >= _PERF_DEFAULT_KEYS:
+                for dk, dv in _PERF_DEFAULTS.items():
+                    if dk not in perf:
+                        perf[dk] = dv
+
+            tids = perf.get("trailing_order_ids")
+            if not isinstance(tids, list):
+                # deque(maxlen) keeps only the tail while consuming: no full-length temp list
+                perf["trailing_order_ids"] = list(deque(tids or (), maxlen=TRAILING_IDS_CAP))
+            elif len(tids) > TRAILING_IDS_CAP:
+                del tids[:-TRAILING_IDS_CAP]
 
         # confidence history hygiene
-        for sym, hist in list(self.entry_confidence_history.items()):
-            k = _symkey(sym)
-            if not k:
-                try:
-                    del self.entry_confidence_history[sym]
-                except Exception:
-                    pass
-                continue
-
-            hist2 = hist if isinstance(hist, list) else (list(hist) if hist is not None else [])
-            cleaned: List[float] = []
-            for x in hist2[-ENTRY_CONF_HISTORY_CAP:]:
-                cleaned.append(_safe_float(x, 0.0))
-
-            if k != sym:
-                try:
-                    del self.entry_confidence_history[sym]
-                except Exception:
-                    pass
-            self.entry_confidence_history[k] = cleaned
-
-        # funding snapshot floats
-        for sym, v in list(self.funding_rate_snapshot.items()):
-            k = _symkey(sym)
-            if not k:
-                try:
-                    del self.funding_rate_snapshot[sym]
-                except Exception:
-                    pass
-                continue
-            fv = _safe_float(v, 0.0)
-            if k != sym:
-                try:
-                    del self.funding_rate_snapshot[sym]
-                except Exception:
-                    pass
-            self.funding_rate_snapshot[k] = fv
+        for k, hist in self.entry_confidence_history.items():
+            if isinstance(hist, list):
+                # slice only when over the cap (_safe_float_list builds a fresh list anyway)
+                tail = hist[-ENTRY_CONF_HISTORY_CAP:] if len(hist) > ENTRY_CONF_HISTORY_CAP else hist
+            elif hist is None:
+                tail = []
+            else:
+                tail = list(deque(hist, maxlen=ENTRY_CONF_HISTORY_CAP))
+            self.entry_confidence_history[k] = _safe_float_list(tail)
+
+        # funding snapshot floats (one batch over all symbols)
+        if self.funding_rate_snapshot:
+            fr = self.funding_rate_snapshot
+            fr.update(zip(fr.keys(), _safe_float_list(list(fr.values()))))
 
     # ---------------------------
     # Derived metrics
     # ---------------------------
+    def _derived_inputs(self) -> Tuple[Any, ...]:
+        return (
+            self.total_wins,
+            self.total_trades,
+            self.peak_equity,
+            self.current_equity,
+            self.win_rate,
+            self.current_drawdown_pct,
+            self.max_drawdown,
+        )
+
     def recompute_derived(self) -> None:
+        # entry/exit/core write the counters and equity directly, so a dirty flag set by our
+        # own setters would go stale. Key the memo on the values instead (outputs included:
+        # an external write to win_rate/drawdown also forces a recompute).
+        if self._derived_key is not None and self._derived_inputs() == self._derived_key:
+            return
+
         self.win_rate = (self.total_wins / self.total_trades) if self.total_trades > 0 else 0.0
 
         if self.peak_equity > 0 and self.current_equity >= 0:
@@ -535,6 +873,8 @@ class PsycheState:
         else:
             self.current_drawdown_pct = 0.0
 
+        self._derived_key = self._derived_inputs()
+
     def update_equity(self, equity: float, *, ts: Optional[float] = None) -> None:
         ts = _safe_float(ts, _now())
         eq = max(0.0, _safe_float(equity, 0.0))
@@ -551,20 +891,21 @@ class PsycheState:
     # ---------------------------
     def cleanup_expired_blacklist(self, now_ts: Optional[float] = None) -> None:
         now_ts = _safe_float(now_ts, _now())
-        expired = []
-        for sym, exp in (self.blacklist or {}).items():
-            if _safe_float(exp, 0.0) <= now_ts:
-                expired.append(sym)
-        for sym in expired:
-            try:
-                del self.blacklist[sym]
-            except Exception:
-                pass
-            try:
-                if sym in self.blacklist_reason:
-                    del self.blacklist_reason[sym]
-            except Exception:
-                pass
+        bl = self.blacklist or {}
+        # Collect only the expired keys: rebuilding the map would cost O(n) inserts even
+        # when nothing expired (the usual case). pop(k, None) needs no try/except.
+        # Expiries are plain floats once validated: compare inline, _safe_float only for the rest.
+        expired = [
+            k for k, v in bl.items()
+            if (v <= now_ts if type(v) is float and v == v else _safe_float(v, 0.0) <= now_ts)
+        ]
+        if not expired:
+            return
+        pop_bl = bl.pop
+        pop_reason = (self.blacklist_reason or {}).pop
+        for k in expired:
+            pop_bl(k, None)
+            pop_reason(k, None)
 
     # ---------------------------
     # Disk-safe serialization
@@ -573,14 +914,50 @@ class PsycheState:
         self.validate()
         self.recompute_derived()
 
-        raw = asdict(self)
-
-        # sets -> lists (cap)
+        # Field order matches the dataclass (what asdict produced). Containers are copied one
+        # level deep; anything nested further is shared — persistence re-walks it anyway.
+        raw: Dict[str, Any] = {
+            "schema_version": self.schema_version,
+            "version": self.version,
+            "run_context": _copy_map_1(self.run_context),
+            "current_equity": self.current_equity,
+            "peak_equity": self.peak_equity,
+            "peak_equity_timestamp": self.peak_equity_timestamp,
+            "current_drawdown_pct": self.current_drawdown_pct,
+            "daily_pnl": self.daily_pnl,
+            "start_of_day_equity": self.start_of_day_equity,
+            "current_day": self.current_day,
+            "total_trades": self.total_trades,
+            "total_wins": self.total_wins,
+            "win_streak": self.win_streak,
+            "positions": {k: p.__msgpack__() for k, p in self.positions.items()},
+            "blacklist": dict(self.blacklist),
+            "blacklist_reason": dict(self.blacklist_reason),
+            "consecutive_losses": dict(self.consecutive_losses),
+            "last_exit_time": dict(self.last_exit_time),
+            "known_exit_order_ids": self.known_exit_order_ids,
+            "symbol_performance": _copy_map_1(self.symbol_performance),
+            "entry_confidence_history": _copy_map_1(self.entry_confidence_history),
+            "streak_history": self.streak_history,
+            "adaptive_risk_multiplier": self.adaptive_risk_multiplier,
+            "funding_paid": self.funding_paid,
+            "funding_rate_snapshot": dict(self.funding_rate_snapshot),
+            "entry_watches": _copy_map_1(self.entry_watches),
+            "session_start_timestamp": self.session_start_timestamp,
+            "uptime_seconds": self.uptime_seconds,
+            "win_rate": self.win_rate,
+            "max_drawdown": self.max_drawdown,
+        }
+
+        # sets -> lists (cap); BoundedOrderedSet keeps insertion order (oldest first)
         kei = raw.get("known_exit_order_ids")
-        if isinstance(kei, set):
+        if isinstance(kei, BoundedOrderedSet):
+            kei_list = [str(x) for x in kei]
+        elif isinstance(kei, set):
             kei_list = sorted(str(x) for x in kei)
         elif isinstance(kei, list):
-            kei_list = [str(x) for x in kei]
+            # str() only the ids that survive the cap
+            kei_list = [str(x) for x in islice(kei, max(0, len(kei) - KNOWN_EXIT_IDS_CAP), None)]
         else:
             kei_list = []
         if len(kei_list) > KNOWN_EXIT_IDS_CAP:
@@ -600,22 +977,39 @@ class PsycheState:
                 raw["current_day"] = None
 
         # streak_history: (date, int, float) -> (iso, int, float)
-        sh = raw.get("streak_history")
-        if isinstance(sh, list):
-            cleaned = []
-            for row in sh:
-                try:
-                    d, n, v = row
-                    d_iso = d.isoformat() if isinstance(d, date) else str(d)
-                    cleaned.append((d_iso, _safe_int(n, 0), _safe_float(v, 0.0)))
-                except Exception:
-                    continue
-            raw["streak_history"] = cleaned
-        else:
-            raw["streak_history"] = []
+        raw["streak_history"] = _streak_rows_to_disk(raw.get("streak_history"))
 
         # entry_watches: keep dict
         ew = raw.get("entry_watches")
         raw["entry_watches"] = ew if isinstance(ew, dict) else {}
 
         return raw
+
+    def __msgpack__(self) -> Dict[str, Any]:
+        """Primitive dict for persistence (same shape as to_dict)."""
+        return self.to_dict()
+
+    def serialize_to_bytes(self) -> bytes:
+        """
+        msgpack bytes with the same shape as to_dict(), encoded in one pass over the live
+        containers: only the top-level view is built, no per-map copies. The bytes are a
+        detached snapshot, so persistence can decode/canonicalize them off the event loop.
+        """
+        self.validate()
+        self.recompute_derived()
+
+        # validate() leaves known_exit_order_ids a BoundedOrderedSet (capped, encoded in
+        # insertion order) and current_day a date or None.
+        view = {name: getattr(self, name) for name in _STATE_FIELD_NAMES}
+        view["positions"] = {k: p.__msgpack__() for k, p in self.positions.items()}
+        cd = self.current_day
+        view["current_day"] = cd.isoformat() if isinstance(cd, date) else None
+        view["streak_history"] = _streak_rows_to_disk(self.streak_history)
+        ew = self.entry_watches
+        view["entry_watches"] = ew if isinstance(ew, dict) else {}
+        return _SNAPSHOT_ENC.encode(view)
+
+
+# Persisted field order for serialize_to_bytes (fields() skips ClassVar entries such as
+# _derived_key, which __dataclass_fields__ would include)
+_STATE_FIELD_NAMES: Tuple[str, ...] = tuple(f.name for f in fields(PsycheState))
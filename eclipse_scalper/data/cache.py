@@ -8,18 +8,47 @@
 # - ✅ bootstrap_markets(): populate raw_symbol aggressively from exchange markets (prefers futures form)
 # - ✅ last_error + fail_streak telemetry (better debugging + adaptive backoff hooks)
 # - ✅ Optional truth guard: get_df(..., require_fresh=True) to block stale indicator poison
+# - ✅ _RingBuf: int64 ts + float32 o/h/l/c/v columns (OHLCV_STORE_DTYPE), float64 rows on output
+# - ✅ OHLCV REST fetches share a semaphore (OHLCV_MAX_INFLIGHT) + pool-wide cooldown on 429/418
+# - ✅ get_price: inline monotonic age probe (price/bidask/funding stay plain dicts: other modules own that contract)
+# - ✅ WS updates accept caller clock readings; update_from_ws_ticker_batch reads the clocks once per batch
+# - ✅ WS OHLCV: out-of-order/replayed candles update or insert by ts (searchsorted) instead of being dropped
+# - ✅ _heal_gaps: gap scan on the stored ts column (np.diff), no get_df DataFrame
+# - ✅ get_df: ts as int64 epoch ms by default (ts_as_dt=True for datetimes); _heal_gaps diffs ints
+# - ✅ _safe_float: None short-circuit (no exception round-trip on sparse ccxt WS fields)
+# - ✅ save/load_cache via orjson when installed (ring arrays serialized as numpy); stdlib json fallback
+# - ✅ get_stale_report: ages/limits for all symbols x checks computed as one numpy pass
+# - ✅ funding_history: deque(maxlen=MAX_FUNDING_HIST) per symbol (O(1) bounded append, no slice copy)
+# - ✅ _normalize_ohlcv_rows: fromiter for plain 6-wide row lists, skip np.unique when already sorted
+# - ✅ _symkey: bounded dict memo (same scheme as brain/state), no per-call string work on hits
+# - ✅ WS 1m ticks coalesce higher-TF derivation into one drainer task (no Task per tick)
+# - ✅ get_df memoized per (symbol, tf) until the ring's next write (version counter)
+# - ✅ _derive_higher_tf: 5m/15m via np reduceat over bucket boundaries (no pandas resample)
+# - ✅ _normalize_ohlcv_rows: pure numpy (np.unique dedupe, pandas only to coerce odd payloads)
+# - ✅ OHLCV stored in per-symbol _RingBuf (preallocated MAX_CANDLES slots; layout per the _RingBuf note above):
+#   O(1) WS append/update, bulk loads copy in place, get_df builds columns straight from the ring arrays
 
 import asyncio
 import time
 import os
 import json
 import sys
-from typing import Dict, List, Tuple, Any, Optional
+from collections import deque
+from collections.abc import Sequence
+from itertools import chain
+from typing import Deque, Dict, List, Tuple, Any, Optional
 
 import numpy as np
 import pandas as pd
 from utils.logging import log_data
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 CACHE_PATH = os.path.expanduser("~/.blade_cosmic_cache.json")
 
 CACHE_VERSION = "cosmic-truth-oracle-ascendant-v4.6-2026-jan21"
@@ -35,8 +64,16 @@ ACCEPTED_CACHE_VERSIONS = {
 MAX_CANDLES = 1200
 MAX_FUNDING_HIST = 12
 
+# WS-driven higher-TF derivation: pending symbols are drained this often
+# (_derive_higher_tf itself still throttles to once per 30s per symbol)
+DERIVE_DRAIN_SEC = 5.0
+
+# REST OHLCV fetches: at most this many in flight across all poll/heal tasks
+OHLCV_MAX_INFLIGHT = 8
+
 # Memory optimization settings
 USE_NUMPY_STORAGE = True  # Use numpy arrays for OHLCV data
+OHLCV_STORE_DTYPE = np.float32  # ring o/h/l/c/v columns (ts is always int64); np.float64 for exact floats
 MEMORY_LIMIT_MB = 500.0   # Max memory for cache (approx)
 
 # Staleness thresholds (seconds) — conservative defaults
@@ -47,22 +84,214 @@ OHLCV_STALE_SEC_5M = 600.0
 OHLCV_STALE_SEC_15M = 1800.0
 
 
+# '/USDT' and ':USDT' -> 'USDT' are separator drops, so the settle suffix is the only
+# real substitution. Same scheme as brain/state: bounded dict memo of raw -> interned key
+# (per-tick WS callers hit it on every message); on overflow it simply starts over.
+_SETTLE_SUFFIX = "/USDT:USDT"
+_DROP_SEPARATORS = str.maketrans("", "", ":/")
+_SYMKEY_MEMO: Dict[str, str] = {}
+_SYMKEY_MEMO_MAX = 4096
+_symkey_memo_get = _SYMKEY_MEMO.get
+
+
 def _symkey(sym: str) -> str:
     """
     Canonical symbol key used throughout the bot: 'BTCUSDT'.
     Handles ccxt forms like 'BTC/USDT:USDT' and 'BTC/USDT'.
     Also collapses 'BTCUSDTUSDT' -> 'BTCUSDT' to match brain/state canon law.
     """
-    s = str(sym or "").upper().strip()
-    s = s.replace("/USDT:USDT", "USDT").replace("/USDT", "USDT")
-    s = s.replace(":USDT", "USDT").replace(":", "")
-    s = s.replace("/", "")
+    if type(sym) is str:
+        ck = _symkey_memo_get(sym)
+        if ck is not None:
+            return ck
+        raw = sym
+    else:
+        raw = str(sym or "")
+
+    s = raw.upper().strip()
+    s = s.replace(_SETTLE_SUFFIX, "USDT").translate(_DROP_SEPARATORS)
     if s.endswith("USDTUSDT"):
         s = s[:-4]
-    return s
+    ck = sys.intern(s) if s else ""
+
+    if len(_SYMKEY_MEMO) >= _SYMKEY_MEMO_MAX:
+        _SYMKEY_MEMO.clear()
+    _SYMKEY_MEMO[raw] = ck
+    return ck
+
+
+_OHLCV_COLS = ["ts", "o", "h", "l", "c", "v"]
+
+
+class _RingBuf(Sequence):
+    """
+    Fixed-capacity OHLCV circular buffer, stored as two parallel columns: ts_ms as int64
+    and o/h/l/c/v as OHLCV_STORE_DTYPE (float32 by default: ~7 significant digits, under
+    half a tick for exchange prices, and 28 instead of 48 bytes per row). Readers always
+    get float64 (N, 6) rows [ts_ms, o, h, l, c, v] from to_array().
+    Rows are kept sorted + unique by ts by the writers (bulk loads are normalized,
+    upsert matches/inserts by ts). `version` is bumped on every write so readers can
+    tell if contents changed.
+    Also a read-only sequence of [ts_ms(int), o, h, l, c, v] row lists (oldest first), so
+    modules that still treat ohlcv[k] as a row list (data_loop merge, strategy 1m
+    fallback, bootstrap readiness) keep working on rings restored by load_cache().
+    """
+
+    __slots__ = ("ts", "vals", "head", "size", "version")
+
+    def __init__(self, cap: int = MAX_CANDLES):
+        cap = max(1, int(cap))
+        self.ts = np.empty(cap, dtype=np.int64)
+        self.vals = np.empty((cap, 5), dtype=OHLCV_STORE_DTYPE)
+        self.head = 0  # next write slot
+        self.size = 0
+        self.version = 0
+
+    @classmethod
+    def from_array(cls, arr: np.ndarray, cap: int = MAX_CANDLES) -> "_RingBuf":
+        rb = cls(cap)
+        rb.load(arr)
+        return rb
+
+    @property
+    def cap(self) -> int:
+        return self.ts.shape[0]
+
+    @property
+    def nbytes(self) -> int:
+        return self.ts.nbytes + self.vals.nbytes
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return self.tolist()[idx]
+        i = int(idx)
+        if i < 0:
+            i += self.size
+        if not 0 <= i < self.size:
+            raise IndexError("_RingBuf index out of range")
+        slot = (self.head - self.size + i) % self.cap
+        return [int(self.ts[slot]), *self.vals[slot].astype(np.float64).tolist()]
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def load(self, arr: np.ndarray) -> None:
+        """Replace contents with the last `cap` rows of a sorted (N, 6) array (in place)."""
+        n = min(len(arr), self.cap)
+        if n:
+            tail = arr[len(arr) - n:]
+            self.ts[:n] = tail[:, 0]
+            self.vals[:n] = tail[:, 1:]
+        self.size = n
+        self.head = n % self.cap
+        self.version += 1
+
+    def last_ts(self) -> float:
+        return float(self.ts[self.head - 1]) if self.size else -1.0
+
+    def _write(self, slot: int, row) -> None:
+        self.ts[slot] = row[0]
+        self.vals[slot] = row[1:6]
+
+    def set_last(self, row) -> None:
+        self._write(self.head - 1, row)
+        self.version += 1
+
+    def append(self, row) -> None:
+        self._write(self.head, row)
+        self.head = (self.head + 1) % self.cap
+        if self.size < self.cap:
+            self.size += 1
+        self.version += 1
+
+    def upsert(self, row) -> None:
+        """
+        Write a candle by ts: append when newer, overwrite when the ts exists, insert when
+        it is a missing older candle (WS replay after reconnect / merged streams).
+        Only the append and last-candle paths are O(1); out-of-order writes are rare and
+        binary-search the ts column, paying an O(N) shift only for a real insert.
+        """
+        ts = row[0]
+        if self.size == 0 or ts > self.ts[self.head - 1]:
+            self.append(row)
+            return
+        if ts == self.ts[self.head - 1]:
+            self.set_last(row)
+            return
+        arr = self.to_array()
+        i = int(np.searchsorted(arr[:, 0], ts))
+        if arr[i, 0] == ts:
+            self._write((self.head - self.size + i) % self.cap, row)
+            self.version += 1
+        elif i > 0 or self.size < self.cap:
+            # older than everything in a full ring: nothing to keep it for
+            self.load(np.insert(arr, i, row, axis=0))
+
+    def to_array(self) -> np.ndarray:
+        """Chronological (size, 6) float64 copy."""
+        n = self.size
+        out = np.empty((n, 6), dtype=np.float64)
+        if n < self.cap or self.head == 0:
+            out[:, 0] = self.ts[:n]
+            out[:, 1:] = self.vals[:n]
+        else:
+            # wrapped: oldest rows start at head
+            k = n - self.head
+            out[:k, 0] = self.ts[self.head:]
+            out[:k, 1:] = self.vals[self.head:]
+            out[k:, 0] = self.ts[:self.head]
+            out[k:, 1:] = self.vals[:self.head]
+        return out
+
+    def tolist(self) -> List[List[Any]]:
+        """Chronological [ts_ms(int), o, h, l, c, v] row lists."""
+        rows = self.to_array().tolist()
+        for r in rows:
+            r[0] = int(r[0])
+        return rows
+
+
+def _rows_array(data: Any) -> np.ndarray:
+    """(N, 6) float64 chronological rows from a _RingBuf, ndarray or list-of-lists."""
+    if isinstance(data, _RingBuf):
+        return data.to_array()
+    if isinstance(data, np.ndarray):
+        return data
+    if not data:
+        return np.empty((0, 6), dtype=np.float64)
+    return np.asarray(data, dtype=np.float64)
+
+
+def _resample_ohlcv(arr: np.ndarray, bucket_ms: int) -> np.ndarray:
+    """
+    Aggregate sorted (N, 6) rows into epoch-aligned buckets of bucket_ms.
+    Same result as resample(...).agg(first/max/min/last/sum).dropna(): empty
+    buckets are skipped, each row is labelled with its bucket start.
+    """
+    if len(arr) == 0:
+        return np.empty((0, 6), dtype=np.float64)
+    bucket = arr[:, 0].astype(np.int64) // bucket_ms
+    # arr is sorted by ts, so bucket starts are where the bucket id changes
+    indptr = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    last = np.r_[indptr[1:], len(arr)] - 1
+    out = np.empty((len(indptr), 6), dtype=np.float64)
+    out[:, 0] = bucket[indptr] * bucket_ms
+    out[:, 1] = arr[indptr, 1]
+    out[:, 2] = np.maximum.reduceat(arr[:, 2], indptr)
+    out[:, 3] = np.minimum.reduceat(arr[:, 3], indptr)
+    out[:, 4] = arr[last, 4]
+    out[:, 5] = np.add.reduceat(arr[:, 5], indptr)
+    return out
 
 
 def _safe_float(x, default: float = 0.0) -> float:
+    # ccxt WS payloads often carry None fields (bid/ask on trade-only tickers): skip the
+    # raise/catch, which costs ~10x a successful float()
+    if x is None:
+        return default
     try:
         v = float(x)
         if v != v:  # NaN
@@ -80,16 +309,17 @@ class GodEmperorDataOracle:
     """
 
     def __init__(self):
-        # Multi-timeframe caches keyed by canonical symkey, stored as rows: [ts_ms, o, h, l, c, v]
-        self.ohlcv: Dict[str, List[List[Any]]] = {}
-        self.ohlcv_5m: Dict[str, List[List[Any]]] = {}
-        self.ohlcv_15m: Dict[str, List[List[Any]]] = {}
+        # Multi-timeframe caches keyed by canonical symkey: _RingBuf of rows [ts_ms, o, h, l, c, v]
+        # (plain row lists written by external loaders are still accepted everywhere)
+        self.ohlcv: Dict[str, Any] = {}
+        self.ohlcv_5m: Dict[str, Any] = {}
+        self.ohlcv_15m: Dict[str, Any] = {}
 
         # Ticker caches keyed by canonical symkey
         self.price: Dict[str, float] = {}
         self.bidask: Dict[str, Tuple[float, float]] = {}
         self.funding: Dict[str, float] = {}
-        self.funding_history: Dict[str, List[float]] = {}
+        self.funding_history: Dict[str, Deque[float]] = {}  # deque(maxlen=MAX_FUNDING_HIST)
 
         # Health / telemetry (wall-clock timestamps, for humans + persistence)
         self.last_poll: Dict[str, float] = {}  # key: f"{k}_{tf}" or k for ticker
@@ -109,12 +339,22 @@ class GodEmperorDataOracle:
         # Task registry (optional)
         self.poll_tasks: Dict[str, asyncio.Task] = {}
 
+        # Shared REST limits: bounded in-flight fetches + pool-wide cooldown after a 429/418
+        self._ohlcv_sem = asyncio.Semaphore(OHLCV_MAX_INFLIGHT)
+        self._rate_limited_until: float = 0.0  # monotonic
+
         # Raw symbol mapping:
         # canonical key -> raw ccxt market symbol used to call exchange methods
         self.raw_symbol: Dict[str, str] = {}
 
         # throttle higher tf derivation per symbol
         self._last_derive_ts: Dict[str, float] = {}
+        # WS 1m ticks only mark symbols here; _derive_loop drains them every DERIVE_DRAIN_SEC
+        self._derive_pending: set = set()
+        self._derive_task: Optional[asyncio.Task] = None
+
+        # get_df memo: (k, tf, ts_as_dt) -> (ring, ring.version, df); any ring write bumps version
+        self._df_cache: Dict[Tuple[str, str, bool], Tuple[Any, int, pd.DataFrame]] = {}
 
     # ---------- time helpers ----------
 
@@ -126,9 +366,10 @@ class GodEmperorDataOracle:
     def _now_mono() -> float:
         return time.monotonic()
 
-    def _mark_success(self, key: str):
-        noww = self._now_wall()
-        nowm = self._now_mono()
+    def _mark_success(self, key: str, now_wall: Optional[float] = None, now_mono: Optional[float] = None):
+        # batch callers read the clocks once and pass them in
+        noww = self._now_wall() if now_wall is None else now_wall
+        nowm = self._now_mono() if now_mono is None else now_mono
         self.last_poll[key] = noww
         self._last_poll_mono[key] = nowm
         self.last_error.pop(key, None)
@@ -155,34 +396,64 @@ class GodEmperorDataOracle:
         return OHLCV_STALE_SEC_1M
 
     @staticmethod
-    def _normalize_ohlcv_rows(raw_rows: List[List[Any]]) -> List[List[Any]]:
+    def _normalize_ohlcv_rows(raw_rows: Any) -> np.ndarray:
         """
-        Ensure rows are [ts_ms(int), o, h, l, c, v] and sorted unique by ts.
+        Ensure rows are [ts_ms, o, h, l, c, v] and sorted unique by ts.
+        Returns a (N, 6) float64 array (empty (0, 6) on bad input).
         Fast enough for 1200 rows, robust against weird inputs.
         """
-        if not raw_rows:
-            return []
-
+        empty = np.empty((0, 6), dtype=np.float64)
+        if raw_rows is None or len(raw_rows) == 0:
+            return empty
+
+        # Numeric payloads (exchange rows, our own arrays) convert in one shot; odd
+        # payloads (numeric strings, None, mixed types) get per-column pandas coercion.
+        # ccxt fetch_ohlcv lists: flat fromiter is ~1.5x faster than asarray on nested lists
+        # (row widths checked first so a short/long row can't shift columns).
         try:
-            df = pd.DataFrame(raw_rows, columns=["ts", "o", "h", "l", "c", "v"])
-        except Exception:
-            return []
-
-        df["ts"] = pd.to_numeric(df["ts"], errors="coerce")
-        df = df.dropna(subset=["ts"])
-        df["ts"] = df["ts"].astype("int64")
-
-        for col in ["o", "h", "l", "c", "v"]:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-        df = df.dropna(subset=["o", "h", "l", "c", "v"])
-
-        df = df.drop_duplicates(subset=["ts"]).sort_values("ts")
-
-        return df[["ts", "o", "h", "l", "c", "v"]].values.tolist()
-
-    def _storage_for_tf(self, tf: str) -> Dict[str, List[List[Any]]]:
+            if type(raw_rows) is list and set(map(len, raw_rows)) == {6}:
+                arr = np.fromiter(chain.from_iterable(raw_rows), np.float64, count=6 * len(raw_rows)).reshape(-1, 6)
+            else:
+                arr = np.asarray(raw_rows, dtype=np.float64)
+        except (TypeError, ValueError):
+            arr = None
+        if arr is None or arr.ndim != 2 or arr.shape[1] != 6:
+            try:
+                df = pd.DataFrame(raw_rows, columns=_OHLCV_COLS)
+            except Exception:
+                return empty
+            arr = np.column_stack(
+                [pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=np.float64) for col in _OHLCV_COLS]
+            )
+
+        # Drop rows with a NaN field or unusable ts, truncate ts to int, keep the first
+        # row per ts. np.unique(return_index) returns ts already sorted, so no extra sort.
+        keep = np.isfinite(arr[:, 0]) & ~np.isnan(arr[:, 1:]).any(axis=1)
+        if not keep.all():
+            arr = arr[keep]
+        ts = arr[:, 0].astype(np.int64)
+        if len(ts) < 2 or (ts[1:] > ts[:-1]).all():
+            # already sorted + unique (the usual exchange payload): no np.unique pass
+            out = arr.copy() if arr is raw_rows else arr
+            out[:, 0] = ts
+            return out
+        _, first = np.unique(ts, return_index=True)
+        out = arr[first]
+        out[:, 0] = ts[first]
+        return out
+
+    def _storage_for_tf(self, tf: str) -> Dict[str, Any]:
         return {"1m": self.ohlcv, "5m": self.ohlcv_5m, "15m": self.ohlcv_15m}.get(tf, self.ohlcv)
 
+    @staticmethod
+    def _store_rows(storage: Dict[str, Any], k: str, arr: np.ndarray) -> None:
+        """Write sorted rows into k's ring (reused in place when present)."""
+        rb = storage.get(k)
+        if isinstance(rb, _RingBuf) and rb.cap == MAX_CANDLES:
+            rb.load(arr)
+        else:
+            storage[k] = _RingBuf.from_array(arr)
+
     def _register_symbol(self, sym: str):
         """Remember canonical<->raw mapping for consistent polling."""
         k = _symkey(sym)
@@ -272,11 +543,13 @@ class GodEmperorDataOracle:
 
     # ---------- public API ----------
 
-    def get_df(self, sym: str, tf: str, *, require_fresh: bool = False) -> pd.DataFrame:
+    def get_df(self, sym: str, tf: str, *, require_fresh: bool = False, ts_as_dt: bool = False) -> pd.DataFrame:
         """
         Accepts raw or canonical, returns dataframe with columns: ts,o,h,l,c,v
-        ts is datetime64[ns, UTC]
+        ts is int64 epoch ms; pass ts_as_dt=True for datetime64[ns, UTC] (plotting/logging).
         If require_fresh=True, returns empty df when tf cache is stale (prevents indicator poison).
+        Ring-backed frames are memoized until the next write: callers get a shared frame
+        and must copy before mutating it.
         """
         k = _symkey(sym)
         if require_fresh:
@@ -285,13 +558,29 @@ class GodEmperorDataOracle:
                 return pd.DataFrame()
 
         storage = self._storage_for_tf(tf)
-        data = storage.get(k, [])
-        if not data:
+        data = storage.get(k)
+        if data is None or len(data) == 0:
             return pd.DataFrame()
 
-        df = pd.DataFrame(data, columns=["ts", "o", "h", "l", "c", "v"])
-        df["ts"] = pd.to_datetime(df["ts"], unit="ms", utc=True, errors="coerce")
-        df = df.dropna(subset=["ts"]).drop_duplicates("ts").sort_values("ts").reset_index(drop=True)
+        is_ring = isinstance(data, _RingBuf)
+        if is_ring:
+            memo_key = (k, tf, ts_as_dt)
+            hit = self._df_cache.get(memo_key)
+            if hit is not None and hit[0] is data and hit[1] == data.version:
+                return hit[2]
+            # ring rows are already sorted + unique
+            arr = data.to_array()
+        else:
+            # rows from an external writer: same cleaning as every other load path
+            arr = self._normalize_ohlcv_rows(data)
+
+        ts_ms = arr[:, 0].astype(np.int64)
+        cols = {"ts": pd.to_datetime(ts_ms, unit="ms", utc=True) if ts_as_dt else ts_ms}
+        for i, name in enumerate(_OHLCV_COLS[1:], 1):
+            cols[name] = arr[:, i]
+        df = pd.DataFrame(cols)
+        if is_ring:
+            self._df_cache[memo_key] = (data, data.version, df)
         return df
 
     def get_cache_age(self, sym: str, tf: str = "1m") -> float:
@@ -319,7 +608,13 @@ class GodEmperorDataOracle:
         Returns 0.0 if stale/unknown.
         """
         k = _symkey(sym)
-        age = self.get_cache_age(k, tf="")  # ticker key uses just k
+        # ticker key is just k: probe the monotonic stamp inline (get_cache_age re-keys and
+        # re-canonicalizes); the wall-clock fallback stays in get_cache_age
+        last_m = self._last_poll_mono.get(k, 0.0) or 0.0
+        if last_m > 0:
+            age = max(0.0, self._now_mono() - float(last_m))
+        else:
+            age = self.get_cache_age(k, tf="")
         stale_limit = PRICE_STALE_SEC_IN_POS if in_position else PRICE_STALE_SEC_IDLE
         if age > stale_limit:
             return 0.0
@@ -348,7 +643,7 @@ class GodEmperorDataOracle:
 
     def get_funding_trend(self, sym: str) -> str:
         k = _symkey(sym)
-        history = self.funding_history.get(k, [])
+        history = self.funding_history.get(k, ())
         if len(history) < 3:
             return "unknown"
         trend = float(history[-1]) - float(history[-3])
@@ -381,70 +676,85 @@ class GodEmperorDataOracle:
         active = set(active_symbols or [])
         posset = set(in_positions or [])
 
-        out = []
-        ok = 0
+        # One slot per (symbol, check) in output order: 1m, 5m, 15m, ticker.
+        ks = sorted(active)
+        n = len(ks)
+        tfs = ("1m", "5m", "15m", "")
+        keys = []
+        for k in ks:
+            ck = _symkey(k)
+            keys += (f"{ck}_1m", f"{ck}_5m", f"{ck}_15m", ck)
+
+        # Ages in one pass (same rule as get_cache_age: monotonic stamp, else wall-clock, else inf)
+        mono_get = self._last_poll_mono.get
+        last_m = np.fromiter((mono_get(key, 0.0) or 0.0 for key in keys), np.float64, count=len(keys))
+        ages = np.full(len(keys), np.inf)
+        has_m = last_m > 0
+        ages[has_m] = np.maximum(0.0, self._now_mono() - last_m[has_m])
+        if not has_m.all():
+            wall_get = self.last_poll.get
+            now_w = self._now_wall()
+            for i in np.flatnonzero(~has_m):
+                last_w = wall_get(keys[i], 0.0) or 0.0
+                if last_w > 0:
+                    ages[i] = max(0.0, now_w - float(last_w))
+
+        limits = np.tile(
+            np.array([self._tf_stale_sec("1m"), self._tf_stale_sec("5m"), self._tf_stale_sec("15m"), PRICE_STALE_SEC_IDLE],
+                     dtype=np.float64),
+            n,
+        )
+        if posset:
+            in_pos = np.fromiter((k in posset for k in ks), bool, count=n)
+            limits[3::4][in_pos] = PRICE_STALE_SEC_IN_POS
 
-        def push(k: str, kind: str, tf: str, age: float, limit: float):
-            key = f"{k}_{tf}" if (kind == "ohlcv") else k
-            if age <= limit:
-                return False
+        out = []
+        for i in np.flatnonzero(ages > limits):
+            key = keys[i]
+            tf = tfs[i & 3]
             out.append({
-                "k": k,
-                "kind": kind,
+                "k": ks[i >> 2],
+                "kind": "ohlcv" if tf else "ticker",
                 "tf": tf,
-                "age": float(age),
-                "limit": float(limit),
+                "age": float(ages[i]),
+                "limit": float(limits[i]),
                 "error": str(self.last_error.get(key) or ""),
                 "fail_streak": int(self.fail_streak.get(key, 0) or 0),
             })
-            return True
-
-        for k in sorted(active):
-            # OHLCV staleness for known TFs
-            for tf in ("1m", "5m", "15m"):
-                key = f"{k}_{tf}"
-                age = self.get_cache_age(k, tf)
-                lim = float(self._tf_stale_sec(tf))
-                if not push(k, "ohlcv", tf, age, lim):
-                    ok += 1
-
-            # Ticker staleness (threshold depends on in_position)
-            age_t = self.get_cache_age(k, tf="")
-            lim_t = float(PRICE_STALE_SEC_IN_POS if (k in posset) else PRICE_STALE_SEC_IDLE)
-            if not push(k, "ticker", "", age_t, lim_t):
-                ok += 1
 
         return {
             "ts": float(self._now_wall()),
             "stale": out,
-            "ok_count": int(ok),
+            "ok_count": int(len(keys) - len(out)),
             "stale_count": int(len(out)),
         }
 
     # ---------- internal ----------
 
-    async def _heal_gaps(self, bot, *, k: str, raw_sym: str, tf: str, storage: Dict[str, List[List[Any]]]):
-        df = self.get_df(k, tf)
-        if df is None or df.empty or len(df) < 3:
+    async def _heal_gaps(self, bot, *, k: str, raw_sym: str, tf: str, storage: Dict[str, Any]):
+        data = storage.get(k)
+        if data is None or len(data) < 3:
+            return
+        # scan straight off the stored rows: no DataFrame for a pass that only needs ts
+        arr = data.to_array() if isinstance(data, _RingBuf) else self._normalize_ohlcv_rows(data)
+        if len(arr) < 3:
             return
 
         expected_ms = self._tf_expected_ms(tf)
-        diffs_ms = df["ts"].diff().dt.total_seconds() * 1000.0
-        gaps = diffs_ms > (expected_ms * 1.5)
-        if not gaps.any():
+        ts_ms = arr[:, 0].astype(np.int64)
+        gap_indices = np.flatnonzero(np.diff(ts_ms) > (expected_ms * 1.5)) + 1
+        if not len(gap_indices):
             return
 
-        gap_indices = df[gaps].index.tolist()
         for idx in gap_indices:
-            prev_ts = df["ts"].iloc[idx - 1]
-            since = int(prev_ts.timestamp() * 1000) + int(expected_ms)
+            since = int(ts_ms[idx - 1]) + int(expected_ms)
             try:
-                raw = await bot.ex.fetch_ohlcv(raw_sym, tf, since=since, limit=300)
+                raw = await self._fetch_ohlcv(bot, raw_sym, tf, since=since, limit=300)
                 rows = self._normalize_ohlcv_rows(raw or [])
-                if rows:
-                    base = storage.get(k, [])
-                    merged = self._normalize_ohlcv_rows((base or []) + rows)
-                    storage[k] = merged[-MAX_CANDLES:]
+                if len(rows):
+                    base = _rows_array(storage.get(k))
+                    merged = self._normalize_ohlcv_rows(np.concatenate((base, rows)) if len(base) else rows)
+                    self._store_rows(storage, k, merged)
                     self.gap_count[f"{k}_{tf}"] = self.gap_count.get(f"{k}_{tf}", 0) + 1
                     log_data.critical(f"COSMIC GAP HEALED {k} {tf} — truth restored")
             except Exception as e:
@@ -460,56 +770,41 @@ class GodEmperorDataOracle:
             return
         self._last_derive_ts[k] = now
 
-        df_1m = self.get_df(k, "1m")
-        if df_1m is None or df_1m.empty:
+        data = self.ohlcv.get(k)
+        arr_1m = data.to_array() if isinstance(data, _RingBuf) else self._normalize_ohlcv_rows(_rows_array(data))
+        if len(arr_1m) == 0:
             return
 
-        df_1m = df_1m.set_index("ts")
-
-        df_5m = (
-            df_1m.resample("5min")
-            .agg({"o": "first", "h": "max", "l": "min", "c": "last", "v": "sum"})
-            .dropna()
-        )
-
-        try:
-            if len(df_5m) > 2:
-                last_ts = df_5m.index[-1]
-                now_utc = pd.Timestamp.now(tz="UTC")
-                if (now_utc - last_ts).total_seconds() < 60:
-                    df_5m = df_5m.iloc[:-1]
-        except Exception:
-            pass
-
-        df_5m = df_5m.reset_index()
-        df_5m_store = df_5m.copy()
-        df_5m_store["ts"] = (df_5m_store["ts"].astype("int64") // 10**6).astype("int64")
-        self.ohlcv_5m[k] = df_5m_store[["ts", "o", "h", "l", "c", "v"]].tail(MAX_CANDLES).values.tolist()
-
-        df_15m = (
-            df_5m.set_index("ts")
-            .resample("15min")
-            .agg({"o": "first", "h": "max", "l": "min", "c": "last", "v": "sum"})
-            .dropna()
-        )
-
-        try:
-            if len(df_15m) > 2:
-                last_ts = df_15m.index[-1]
-                now_utc = pd.Timestamp.now(tz="UTC")
-                if (now_utc - last_ts).total_seconds() < 120:
-                    df_15m = df_15m.iloc[:-1]
-        except Exception:
-            pass
-
-        df_15m = df_15m.reset_index()
-        df_15m_store = df_15m.copy()
-        df_15m_store["ts"] = (df_15m_store["ts"].astype("int64") // 10**6).astype("int64")
-        self.ohlcv_15m[k] = df_15m_store[["ts", "o", "h", "l", "c", "v"]].tail(MAX_CANDLES).values.tolist()
+        now_ms = now * 1000.0
+
+        # Drop the still-forming bucket (label within 60s / 120s of now), as before.
+        arr_5m = _resample_ohlcv(arr_1m, 300_000)
+        if len(arr_5m) > 2 and now_ms - arr_5m[-1, 0] < 60_000:
+            arr_5m = arr_5m[:-1]
+        self._store_rows(self.ohlcv_5m, k, arr_5m[-MAX_CANDLES:])
+
+        arr_15m = _resample_ohlcv(arr_5m, 900_000)
+        if len(arr_15m) > 2 and now_ms - arr_15m[-1, 0] < 120_000:
+            arr_15m = arr_15m[:-1]
+        self._store_rows(self.ohlcv_15m, k, arr_15m[-MAX_CANDLES:])
+
+    async def _derive_loop(self):
+        """Drain symbols marked by WS 1m updates; exits once nothing is pending (restarted lazily)."""
+        while self._derive_pending:
+            await asyncio.sleep(DERIVE_DRAIN_SEC)
+            pending = self._derive_pending
+            self._derive_pending = set()
+            for k in pending:
+                try:
+                    await self._derive_higher_tf(k)
+                except Exception as e:
+                    log_data.debug(f"derive higher tf error {k}: {e}")
 
     # ---------- WebSocket update methods ----------
 
-    def update_from_ws_ticker(self, sym: str, ticker: dict) -> None:
+    def update_from_ws_ticker(
+        self, sym: str, ticker: dict, *, now_wall: Optional[float] = None, now_mono: Optional[float] = None
+    ) -> None:
         """
         Update cache from WebSocket ticker data.
         Called by WebSocketStreamManager when new ticker arrives.
@@ -517,6 +812,7 @@ class GodEmperorDataOracle:
         Args:
             sym: Symbol (raw or canonical)
             ticker: Ticker dict with 'last', 'bid', 'ask', etc.
+            now_wall/now_mono: clock readings to stamp with (read here when omitted)
         """
         k = _symkey(sym)
         if not k:
@@ -540,9 +836,21 @@ class GodEmperorDataOracle:
             self.bidask[k] = (last, last)
 
         # Mark success for staleness tracking
-        self._mark_success(k)
+        self._mark_success(k, now_wall, now_mono)
 
-    def update_from_ws_ohlcv(self, sym: str, tf: str, candle: list) -> None:
+    def update_from_ws_ticker_batch(self, items: List[Tuple[str, dict]]) -> None:
+        """
+        Apply a batch of (sym, ticker) updates with one wall/monotonic clock read
+        for the whole batch instead of two per ticker.
+        """
+        now_wall = self._now_wall()
+        now_mono = self._now_mono()
+        for sym, ticker in items:
+            self.update_from_ws_ticker(sym, ticker, now_wall=now_wall, now_mono=now_mono)
+
+    def update_from_ws_ohlcv(
+        self, sym: str, tf: str, candle: list, *, now_wall: Optional[float] = None, now_mono: Optional[float] = None
+    ) -> None:
         """
         Update cache from WebSocket OHLCV data.
         Called by WebSocketStreamManager when new candle arrives.
@@ -572,38 +880,32 @@ class GodEmperorDataOracle:
             if c <= 0:
                 return
 
-            new_row = [ts_ms, o, h, l, c, v]
+            new_row = (ts_ms, o, h, l, c, v)
 
-            # Get existing data
-            existing = storage.get(k, [])
+            # Get existing ring (adopt rows written by an external loader once)
+            rb = storage.get(k)
+            if not isinstance(rb, _RingBuf):
+                rb = _RingBuf.from_array(self._normalize_ohlcv_rows(rb) if rb is not None and len(rb) else _rows_array(None))
+                storage[k] = rb
 
-            if not existing:
-                storage[k] = [new_row]
-            else:
-                # Check if this candle already exists (update) or is new (append)
-                last_ts = existing[-1][0] if existing else 0
-
-                if ts_ms == last_ts:
-                    # Update last candle (in-progress candle)
-                    existing[-1] = new_row
-                elif ts_ms > last_ts:
-                    # New candle - append
-                    existing.append(new_row)
-                    # Trim to max
-                    if len(existing) > MAX_CANDLES:
-                        storage[k] = existing[-MAX_CANDLES:]
-                # else: old candle, ignore
-
-            self._mark_success(key)
-
-            # Derive higher TFs if 1m
+            # New candle appends, in-progress candle updates in place (both O(1));
+            # replayed/out-of-order candles are matched or inserted by ts
+            rb.upsert(new_row)
+
+            self._mark_success(key, now_wall, now_mono)
+
+            # Derive higher TFs if 1m (coalesced: one drainer task, not one task per tick)
             if tf == "1m":
-                asyncio.create_task(self._derive_higher_tf(k))
+                self._derive_pending.add(k)
+                if self._derive_task is None or self._derive_task.done():
+                    self._derive_task = asyncio.create_task(self._derive_loop())
 
         except Exception as e:
             log_data.debug(f"WS OHLCV update error {k} {tf}: {e}")
 
-    def update_from_ws_orderbook(self, sym: str, orderbook: dict) -> None:
+    def update_from_ws_orderbook(
+        self, sym: str, orderbook: dict, *, now_wall: Optional[float] = None, now_mono: Optional[float] = None
+    ) -> None:
         """
         Update cache from WebSocket orderbook data.
         Extracts best bid/ask for spread tracking.
@@ -632,9 +934,11 @@ class GodEmperorDataOracle:
                 if k not in self.price or self.price[k] <= 0:
                     self.price[k] = (best_bid + best_ask) / 2.0
 
-                self._mark_success(k)
+                self._mark_success(k, now_wall, now_mono)
 
-    def update_from_ws_trades(self, sym: str, trades: list) -> None:
+    def update_from_ws_trades(
+        self, sym: str, trades: list, *, now_wall: Optional[float] = None, now_mono: Optional[float] = None
+    ) -> None:
         """
         Update cache from WebSocket trade data.
         Uses latest trade price.
@@ -655,7 +959,7 @@ class GodEmperorDataOracle:
             price = _safe_float(latest.get("price"), 0.0)
             if price > 0:
                 self.price[k] = price
-                self._mark_success(k)
+                self._mark_success(k, now_wall, now_mono)
 
     # ---------- Memory optimization utilities ----------
 
@@ -677,11 +981,13 @@ class GodEmperorDataOracle:
             "estimated_mb": 0.0,
         }
 
-        # Estimate memory (rough)
-        # Each candle: ~6 floats * 8 bytes = 48 bytes + list overhead ~100 bytes per candle
+        # Estimate memory: rings are preallocated (cap * 28 bytes with float32); legacy row lists ~100 bytes per candle
         candle_bytes = 100
-        total_candles = stats["total_candles_1m"] + stats["total_candles_5m"] + stats["total_candles_15m"]
-        stats["estimated_mb"] = (total_candles * candle_bytes) / (1024 * 1024)
+        total_bytes = 0
+        for storage in (self.ohlcv, self.ohlcv_5m, self.ohlcv_15m):
+            for v in storage.values():
+                total_bytes += v.nbytes if isinstance(v, _RingBuf) else len(v) * candle_bytes
+        stats["estimated_mb"] = total_bytes / (1024 * 1024)
 
         return stats
 
@@ -701,7 +1007,7 @@ class GodEmperorDataOracle:
             return 0
 
         removed = 0
-        candle_bytes = 100
+        candle_bytes = 8 + 5 * np.dtype(OHLCV_STORE_DTYPE).itemsize  # ring row: int64 ts + 5 values
         target_candles = int((target_mb * 1024 * 1024) / candle_bytes)
 
         # Calculate how many candles to keep per symbol
@@ -711,12 +1017,14 @@ class GodEmperorDataOracle:
 
         candles_per_symbol = max(100, target_candles // total_symbols)
 
-        # Trim each storage
+        # Trim each storage (shrunk rings keep a smaller capacity so the limit holds)
         for storage in [self.ohlcv, self.ohlcv_5m, self.ohlcv_15m]:
             for k, data in storage.items():
-                if len(data) > candles_per_symbol:
-                    removed += len(data) - candles_per_symbol
-                    storage[k] = data[-candles_per_symbol:]
+                if len(data) > candles_per_symbol or (isinstance(data, _RingBuf) and data.cap > candles_per_symbol):
+                    removed += max(0, len(data) - candles_per_symbol)
+                    storage[k] = _RingBuf.from_array(_rows_array(data), cap=candles_per_symbol)
+        # memoized frames pin the old rings: drop them so the trim actually frees memory
+        self._df_cache.clear()
 
         if removed > 0:
             log_data.info(f"MEMORY OPTIMIZATION: Trimmed {removed} candles to stay under {target_mb}MB")
@@ -736,17 +1044,25 @@ class GodEmperorDataOracle:
         """
         k = _symkey(sym)
         storage = self._storage_for_tf(tf)
-        data = storage.get(k, [])
+        data = storage.get(k)
 
-        if not data:
+        if data is None or len(data) == 0:
             return None
 
         try:
-            return np.array(data, dtype=np.float64)
+            return data.to_array() if isinstance(data, _RingBuf) else np.array(data, dtype=np.float64)
         except Exception:
             return None
 
-    async def poll_ohlcv(self, bot, sym: str, tf: str, storage: Dict[str, List[List[Any]]], interval: int = 11):
+    async def _fetch_ohlcv(self, bot, raw_sym: str, tf: str, **kwargs) -> Any:
+        """fetch_ohlcv behind the shared in-flight limit; waits out a pool-wide rate-limit cooldown first."""
+        wait = self._rate_limited_until - self._now_mono()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        async with self._ohlcv_sem:
+            return await bot.ex.fetch_ohlcv(raw_sym, tf, **kwargs)
+
+    async def poll_ohlcv(self, bot, sym: str, tf: str, storage: Dict[str, Any], interval: int = 11):
         self._register_symbol(sym)
         k = _symkey(sym)
         raw_sym = self._resolve_raw(k, sym)
@@ -771,10 +1087,10 @@ class GodEmperorDataOracle:
             total_count += 1
 
             try:
-                raw = await bot.ex.fetch_ohlcv(raw_sym, tf, limit=MAX_CANDLES)
+                raw = await self._fetch_ohlcv(bot, raw_sym, tf, limit=MAX_CANDLES)
                 rows = self._normalize_ohlcv_rows(raw or [])
-                if rows:
-                    storage[k] = rows[-MAX_CANDLES:]
+                if len(rows):
+                    self._store_rows(storage, k, rows)
                     self._mark_success(key)
                     success_count += 1
                     backoff = 0.0
@@ -790,6 +1106,8 @@ class GodEmperorDataOracle:
                 es = str(e)
                 if "429" in es or "418" in es:
                     backoff = min(backoff + 60.0, 900.0)
+                    # the limit is per account, not per symbol: hold every OHLCV fetch
+                    self._rate_limited_until = max(self._rate_limited_until, self._now_mono() + backoff)
                     log_data.critical(f"COSMIC RATE LIMIT {key} — sleeping +{backoff:.0f}s")
                 else:
                     backoff = min(backoff + 10.0, 180.0)
@@ -858,9 +1176,10 @@ class GodEmperorDataOracle:
                     funding = _safe_float((t or {}).get("fundingRate"), 0.0)
 
                 self.funding[k] = funding
-                hist = self.funding_history.setdefault(k, [])
+                hist = self.funding_history.get(k)
+                if type(hist) is not deque:
+                    hist = self.funding_history[k] = deque(hist or (), maxlen=MAX_FUNDING_HIST)
                 hist.append(float(funding))
-                self.funding_history[k] = hist[-MAX_FUNDING_HIST:]
 
                 self._mark_success(k)
                 backoff = 0.0
@@ -880,22 +1199,33 @@ class GodEmperorDataOracle:
 
     # ---------- persistence ----------
 
+    @staticmethod
+    def _rows_for_save(v: Any) -> Any:
+        if isinstance(v, _RingBuf):
+            # orjson writes the (N, 6) float64 array directly (OPT_SERIALIZE_NUMPY), no tolist()
+            return v.to_array() if ORJSON_AVAILABLE else v.tolist()
+        return v[-MAX_CANDLES:] if isinstance(v, list) else []
+
     async def save_cache(self):
         try:
             cache_data = {
                 "version": CACHE_VERSION,
                 "timestamp": self._now_wall(),
-                "ohlcv": {k: (v[-MAX_CANDLES:] if isinstance(v, list) else []) for k, v in (self.ohlcv or {}).items()},
-                "ohlcv_5m": {k: (v[-MAX_CANDLES:] if isinstance(v, list) else []) for k, v in (self.ohlcv_5m or {}).items()},
-                "ohlcv_15m": {k: (v[-MAX_CANDLES:] if isinstance(v, list) else []) for k, v in (self.ohlcv_15m or {}).items()},
+                "ohlcv": {k: self._rows_for_save(v) for k, v in (self.ohlcv or {}).items()},
+                "ohlcv_5m": {k: self._rows_for_save(v) for k, v in (self.ohlcv_5m or {}).items()},
+                "ohlcv_15m": {k: self._rows_for_save(v) for k, v in (self.ohlcv_15m or {}).items()},
                 "funding_history": {
-                    k: (list(map(float, v))[-MAX_FUNDING_HIST:] if isinstance(v, list) else [])
+                    k: (list(map(float, v))[-MAX_FUNDING_HIST:] if isinstance(v, (list, deque)) else [])
                     for k, v in (self.funding_history or {}).items()
                 },
                 "raw_symbol": {k: str(v) for k, v in (self.raw_symbol or {}).items()},
             }
-            with open(CACHE_PATH, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f)
+            if ORJSON_AVAILABLE:
+                with open(CACHE_PATH, "wb") as f:
+                    f.write(orjson.dumps(cache_data, option=orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(CACHE_PATH, "w", encoding="utf-8") as f:
+                    json.dump(cache_data, f)
             log_data.critical("COSMIC CACHE PRESERVED — truth eternal")
         except Exception as e:
             log_data.error(f"Cache preservation failed: {e}")
@@ -905,8 +1235,13 @@ class GodEmperorDataOracle:
             return False
 
         try:
-            with open(CACHE_PATH, encoding="utf-8") as f:
-                data = json.load(f)
+            with open(CACHE_PATH, "rb") as f:
+                raw = f.read()
+            try:
+                data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+            except ValueError:
+                # files written by stdlib json may carry NaN/Infinity tokens orjson rejects
+                data = json.loads(raw)
 
             v = str(data.get("version") or "")
             if v not in ACCEPTED_CACHE_VERSIONS:
@@ -917,21 +1252,21 @@ class GodEmperorDataOracle:
                 ck = _symkey(k)
                 if not ck:
                     continue
-                self.ohlcv[ck] = self._normalize_ohlcv_rows(rows or [])[-MAX_CANDLES:]
+                self.ohlcv[ck] = _RingBuf.from_array(self._normalize_ohlcv_rows(rows or []))
 
             self.ohlcv_5m = {}
             for k, rows in (data.get("ohlcv_5m", {}) or {}).items():
                 ck = _symkey(k)
                 if not ck:
                     continue
-                self.ohlcv_5m[ck] = self._normalize_ohlcv_rows(rows or [])[-MAX_CANDLES:]
+                self.ohlcv_5m[ck] = _RingBuf.from_array(self._normalize_ohlcv_rows(rows or []))
 
             self.ohlcv_15m = {}
             for k, rows in (data.get("ohlcv_15m", {}) or {}).items():
                 ck = _symkey(k)
                 if not ck:
                     continue
-                self.ohlcv_15m[ck] = self._normalize_ohlcv_rows(rows or [])[-MAX_CANDLES:]
+                self.ohlcv_15m[ck] = _RingBuf.from_array(self._normalize_ohlcv_rows(rows or []))
 
             self.funding_history = {}
             fh = data.get("funding_history", {}) or {}
@@ -941,11 +1276,11 @@ class GodEmperorDataOracle:
                     continue
                 if isinstance(vlist, list):
                     try:
-                        self.funding_history[ck] = [float(x) for x in vlist][-MAX_FUNDING_HIST:]
+                        self.funding_history[ck] = deque(map(float, vlist), maxlen=MAX_FUNDING_HIST)
                     except Exception:
-                        self.funding_history[ck] = []
+                        self.funding_history[ck] = deque(maxlen=MAX_FUNDING_HIST)
                 else:
-                    self.funding_history[ck] = []
+                    self.funding_history[ck] = deque(maxlen=MAX_FUNDING_HIST)
 
             self.raw_symbol = {}
             rs = data.get("raw_symbol", {}) or {}
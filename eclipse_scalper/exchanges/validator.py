@@ -6,9 +6,9 @@ import json
 from datetime import datetime, timezone
 from utils.logging import log_core, log
 from config.symbols import BASE_SYMBOLS
-from config.settings import Config
+from config.settings import get_config
 
-cfg = Config()
+cfg = get_config()
 
 # COSMIC VALIDATION CACHE — ETERNAL MEMORY OF DIVINE JUDGMENT
 _validation_cache = {
@@ -15,6 +15,7 @@ import os
 import signal
 import sys
 import time
+from collections.abc import Sequence
 from types import SimpleNamespace
 from typing import Any, Optional, Callable, Awaitable, List
 
@@ -139,6 +140,9 @@ def _apply_env_symbols_to_cfg(cfg: Any) -> list[str]:
         return []
     try:
         setattr(cfg, "ACTIVE_SYMBOLS", syms)
+        refresh = getattr(cfg, "refresh_entry_params", None)
+        if callable(refresh):
+            refresh()
     except Exception:
         pass
     return syms
@@ -558,7 +562,8 @@ def _data_has_any_market_data(obj: Any) -> bool:
         ohlcv = getattr(obj, "ohlcv", None)
         if isinstance(ohlcv, dict):
             for v in ohlcv.values():
-                if isinstance(v, list) and len(v) >= 5:
+                # row lists, or data/cache ring buffers (Sequence of rows)
+                if isinstance(v, Sequence) and not isinstance(v, (str, bytes)) and len(v) >= 5:
                     return True
     except Exception:
         pass
@@ -636,6 +636,6 @@ async def emergency_flat(bot, reason: str = "COSMIC_CHAOS", forced: bool = False
         await _safe_speak(bot, f"WARNING: Failed salvation plans on: {', '.join(failed_symbols[:40])}", "critical")
 
     try:
-        await save_brain(bot.state, force=True)
+        await save_brain(bot.state, force=True, durable=True)
     except Exception as pe:
         log_core.error(f"Brain save failed after emergency: {pe}")
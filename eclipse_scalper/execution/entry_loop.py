@@ -5,6 +5,7 @@
 # - ✅ HARDEN: Optional open-orders / open-position probe (best-effort) to detect real exposure even if brain-state is stale
 # - ✅ SAFETY: backoff on margin-insufficient (-2019) retained
 # - ✅ Keeps: ENV-first overrides, sizing resolver, tuple adapter, throttled logs, guardian-safe (never raises)
+# - ✅ ENTRY_* knobs resolved once into an EntryConfigView (no per-order env/cfg reads)
 
 from __future__ import annotations
 
@@ -13,6 +14,7 @@ import os
 import time
 from typing import Any, Dict, Optional, Callable, Tuple
 
+from config.settings import EntryConfigView
 from utils.logging import log_entry, log_core
 from execution.order_router import create_order
 
@@ -94,6 +96,52 @@ def _cfg_env_bool(bot, name: str, default: Any = False) -> bool:
     return _truthy(_cfg(bot, name, default))
 
 
+# Loop defaults when neither ENV nor cfg provides a (non-zero) value
+_ENTRY_VIEW_DEFAULTS = EntryConfigView(
+    MIN_CONFIDENCE=0.0,
+    POLL_SEC=1.0,
+    PER_SYMBOL_GAP_SEC=2.5,
+    LOCAL_COOLDOWN_SEC=8.0,
+    RESPECT_KILL_SWITCH=True,
+    ROUTER_RETRIES=6,
+    NOTIFY=False,
+)
+
+
+def _resolve_entry_view(bot) -> EntryConfigView:
+    """
+    ENTRY_* knobs resolved once per loop start: ENV wins, then cfg, then default.
+    Uses cfg.entry_view() when available instead of one getattr per knob.
+    """
+    ev = None
+    try:
+        fn = getattr(getattr(bot, "cfg", None), "entry_view", None)
+        if callable(fn):
+            ev = fn()
+    except Exception:
+        ev = None
+    if not isinstance(ev, EntryConfigView):
+        ev = EntryConfigView(*(
+            _cfg(bot, "ENTRY_" + name, d) for name, d in zip(EntryConfigView._fields, _ENTRY_VIEW_DEFAULTS)
+        ))
+
+    out = {}
+    for name, v, d in zip(EntryConfigView._fields, ev, _ENTRY_VIEW_DEFAULTS):
+        env = _env_get("ENTRY_" + name)
+        if isinstance(d, bool):
+            out[name] = _truthy(env) if env != "" else _truthy(v)
+            continue
+        try:
+            x = float(env) if env != "" else float(v or d)
+        except Exception:
+            try:
+                x = float(v or d)
+            except Exception:
+                x = float(d)
+        out[name] = int(x or d) if type(d) is int else x
+    return EntryConfigView(**out)
+
+
 def _symkey(sym: str) -> str:
     s = (sym or "").upper().strip()
     s = s.replace("/USDT:USDT", "USDT").replace("/USDT", "USDT")
@@ -143,9 +191,16 @@ def _pick_symbols(bot) -> list[str]:
         pass
 
     try:
-        s2 = getattr(getattr(bot, "cfg", None), "ACTIVE_SYMBOLS", None)
-        if isinstance(s2, (list, tuple)) and s2:
-            return [str(x) for x in s2 if str(x).strip()]
+        cfg = getattr(bot, "cfg", None)
+        ep = getattr(cfg, "entry_params", None)
+        if ep is not None:
+            # already cleaned to non-blank strings when the snapshot was built
+            if ep.ACTIVE_SYMBOLS:
+                return list(ep.ACTIVE_SYMBOLS)
+        else:
+            s2 = getattr(cfg, "ACTIVE_SYMBOLS", None)
+            if isinstance(s2, (list, tuple)) and s2:
+                return [str(x) for x in s2 if str(x).strip()]
     except Exception:
         pass
 
@@ -237,7 +292,10 @@ def _resolve_sizing(bot) -> tuple[float, float]:
     if fixed_qty <= 0:
         fixed_qty = _cfg_float(cfg_obj, "FIXED_QTY", "ORDER_QTY", "QTY", default=0.0)
 
-    if fixed_notional <= 0:
+    ep = getattr(cfg_obj, "entry_params", None)
+    if fixed_notional <= 0 and ep is not None and ep.FIXED_NOTIONAL_USDT != 0.0:
+        fixed_notional = ep.FIXED_NOTIONAL_USDT
+    elif fixed_notional <= 0:
         fixed_notional = _cfg_float(
             cfg_obj,
             "FIXED_NOTIONAL_USDT",
@@ -635,16 +693,19 @@ async def entry_loop(bot) -> None:
     """
     shutdown_ev = _ensure_shutdown_event(bot)
 
-    # ENV overrides for safety knobs
-    poll_sec = _cfg_env_float(bot, "ENTRY_POLL_SEC", 1.0)
-    per_symbol_gap_sec = _cfg_env_float(bot, "ENTRY_PER_SYMBOL_GAP_SEC", 2.5)
-    local_cooldown_sec = _cfg_env_float(bot, "ENTRY_LOCAL_COOLDOWN_SEC", 8.0)
-    min_conf = _cfg_env_float(bot, "ENTRY_MIN_CONFIDENCE", 0.0)
+    # ENV overrides for safety knobs (ENTRY_* resolved once into a view)
+    ev = _resolve_entry_view(bot)
+    poll_sec = ev.POLL_SEC
+    per_symbol_gap_sec = ev.PER_SYMBOL_GAP_SEC
+    local_cooldown_sec = ev.LOCAL_COOLDOWN_SEC
+    min_conf = ev.MIN_CONFIDENCE
+    # MARKET entries keep their own 4-retry default when ENV/cfg leave ENTRY_ROUTER_RETRIES unset
+    market_router_retries = int(_cfg_env_float(bot, "ENTRY_ROUTER_RETRIES", 4) or 4)
 
     # NEW: pending-block window after submit to stop stacking while reconcile adopts
     pending_block_sec = _cfg_env_float(bot, "ENTRY_PENDING_BLOCK_SEC", 30.0)
 
-    respect_kill = bool(_cfg_env_bool(bot, "ENTRY_RESPECT_KILL_SWITCH", True))
+    respect_kill = ev.RESPECT_KILL_SWITCH
 
     # Hedge hint mode can be set via ENV too
     hedge_hint_mode = bool(
@@ -826,7 +887,7 @@ async def entry_loop(bot) -> None:
                                 intent_reduce_only=False,
                                 intent_close_position=False,
                                 hedge_side_hint=hedge_side_hint,
-                                retries=int(_cfg_env_float(bot, "ENTRY_ROUTER_RETRIES", 6) or 6),
+                                retries=ev.ROUTER_RETRIES,
                             )
                         else:
                             res = await create_order(
@@ -840,7 +901,7 @@ async def entry_loop(bot) -> None:
                                 intent_reduce_only=False,
                                 intent_close_position=False,
                                 hedge_side_hint=hedge_side_hint,
-                                retries=int(_cfg_env_float(bot, "ENTRY_ROUTER_RETRIES", 4) or 4),
+                                retries=market_router_retries,
                             )
 
                         oid = None
@@ -907,7 +968,7 @@ async def entry_loop(bot) -> None:
                             except Exception:
                                 pass
 
-                        if _truthy(_cfg(bot, "ENTRY_NOTIFY", False)):
+                        if ev.NOTIFY:
                             await _safe_speak(bot, f"ENTRY {k} {action.upper()} {otype} amt={amt}", "info")
 
                     except asyncio.CancelledError:
@@ -757,9 +757,10 @@ async def handle_exit(bot, order: dict):
         # Calculate ATR percentage for volatility adjustment
         atr_pct = stop_pct  # stop_pct is already atr * mult / price
 
-        cb_main_base = _clamp(float(cfg.TRAILING_CALLBACK_RATE), 0.1, 5.0)
-        cb_tight_base = _clamp(float(cfg.TRAILING_TIGHT_PCT), 0.1, 5.0)
-        cb_loose_base = _clamp(float(cfg.TRAILING_LOOSE_PCT), 0.1, 5.0)
+        # Clamped to [0.1, 5.0] once in Config._compute_derived()
+        cb_main_base = cfg.trailing_cb_main
+        cb_tight_base = cfg.trailing_cb_tight
+        cb_loose_base = cfg.trailing_cb_loose
 
         # Apply volatility adjustment if enabled
         cb_main = _calculate_vol_adjusted_callback(cfg, atr_pct, cb_main_base)
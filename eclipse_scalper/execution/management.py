@@ -1,9 +1,9 @@
 # execution/management.py
 import asyncio
-from config.settings import Config
+from config.settings import get_config
 from utils.logging import log
 
-cfg = Config()
+cfg = get_config()
 
 async def manage_position(bot, sym: str, pos):
     """Trailing stop + breakeven management"""
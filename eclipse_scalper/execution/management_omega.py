@@ -1,9 +1,9 @@
 # execution/management_omega.py
 import asyncio
 from utils.logging import log_entry
-from config.settings import Config
+from config.settings import get_config
 
-cfg = Config()
+cfg = get_config()
 
 async def manage_position_omega(bot, sym: str, pos, confidence: float):
     """
@@ -132,17 +132,26 @@ def _default_path() -> str:
 
 
 def _get_path(bot) -> str:
+    # Config resolves the full fallback chain once (cfg.telemetry_path)
+    p = _cfg(bot, "telemetry_path", "")
+    if p:
+        return p
     p = _cfg(bot, "TELEMETRY_PATH", "") or os.getenv("TELEMETRY_PATH", "")
     if not p:
         p = _default_path()
     return str(p)
 
 
+# Directories already created: skip the makedirs syscall on every append
+_ENSURED_DIRS: set = set()
+
+
 def _ensure_dir(path: str) -> None:
     try:
         d = os.path.dirname(path)
-        if d:
+        if d and d not in _ENSURED_DIRS:
             os.makedirs(d, exist_ok=True)
+            _ENSURED_DIRS.add(d)
     except Exception:
         pass
 
@@ -173,7 +182,14 @@ async def _append_line(path: str, line: str) -> None:
     """
     def _write():
         _ensure_dir(path)
-        with open(path, "a", encoding="utf-8") as f:
+        try:
+            f = open(path, "a", encoding="utf-8")
+        except FileNotFoundError:
+            # log dir removed since it was cached: recreate once
+            _ENSURED_DIRS.discard(os.path.dirname(path))
+            _ensure_dir(path)
+            f = open(path, "a", encoding="utf-8")
+        with f:
             f.write(line + "\n")
 
     await _to_thread(_write)
@@ -20,11 +20,11 @@ from bot.core import EclipseEternal
 from utils.logging import log_core
 from execution.emergency import emergency_flat
 from strategies.risk import portfolio_heat
-from config.settings import Config
+from config.settings import get_config
 from brain.state import Position
 from notifications.telegram import Notifier
 
-cfg = Config()
+cfg = get_config()
 
 commander = Notifier(token=os.getenv('TELEGRAM_TOKEN'), chat_id=os.getenv('TELEGRAM_CHAT_ID')) if os.getenv('TELEGRAM_TOKEN') else None
 
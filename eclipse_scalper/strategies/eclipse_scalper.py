@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import os
 import time
+from collections.abc import Sequence
 from datetime import datetime, timezone
 
 import numpy as np
@@ -241,10 +242,15 @@ def _tf_minutes(tf: str) -> int:
     return 1
 
 
+def _is_row_seq(rows) -> bool:
+    """Row list or data/cache ring buffer (a Sequence of [ts_ms, o, h, l, c, v] rows)."""
+    return isinstance(rows, Sequence) and not isinstance(rows, (str, bytes))
+
+
 def _df_from_ohlcv_rows(rows: list) -> pd.DataFrame | None:
     """rows: [[ts_ms, o, h, l, c, v], ...] -> df(ts,o,h,l,c,v)"""
     try:
-        if not isinstance(rows, list) or len(rows) < 10:
+        if not _is_row_seq(rows) or len(rows) < 10:
             return None
         data = []
         for r in rows:
@@ -361,7 +367,7 @@ def _get_df_flexible(data_obj, sym: str, tf: str) -> tuple[pd.DataFrame | None,
     for key in keys:
         try:
             rows = ohlcv_map.get(key)
-            if isinstance(rows, list) and len(rows) >= 10:
+            if _is_row_seq(rows) and len(rows) >= 10:
                 rows_1m = rows
                 used = key
                 break
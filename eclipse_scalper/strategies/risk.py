@@ -1,7 +1,7 @@
 import numpy as np
-from config.settings import Config
+from config.settings import get_config
 
-cfg = Config()
+cfg = get_config()
 
 def optimal_risk_pct(atr_pct: float) -> float:
     kelly = cfg.BASE_EDGE / cfg.EXPECTED_RR